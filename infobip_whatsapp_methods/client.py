@@ -6,12 +6,15 @@ for all WhatsApp messaging operations using the Infobip WhatsApp Business API.
 """
 
 import os
+import sys
 import requests
 import time
 import logging
+import functools
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Set, Tuple, Union
 from urllib.parse import urlparse
 import mimetypes
 
@@ -21,6 +24,7 @@ from .constants import (
     StatusCodes,
     AutoResponseTemplates,
     MediaTypes,
+    MessageTypes,
     FileLimits,
     Defaults,
     DEFAULT_TIMEOUT,
@@ -34,7 +38,11 @@ from .models import (
     AutoResponseResult,
     LocationData,
     TemplateData,
-    LEBANON_LOCATIONS
+    LEBANON_LOCATIONS,
+    LEBANON_LOCATIONS_PAYLOAD,
+    WebhookMessage,
+    WebhookMessageTuple,
+    STATUS_READ
 )
 from .exceptions import (
     WhatsAppError,
@@ -61,11 +69,82 @@ from .validators import (
     validate_all_message_params,
     validate_location_params
 )
-from .models import WebhookMessage
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Shared read-only fallback for missing nested webhook objects
+_EMPTY: Dict[str, Any] = {}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO-8601 timestamp, memoized since webhook bursts share timestamps."""
+    return datetime.fromisoformat(timestamp)
+
+
+def _parse_webhook_batch(
+    results: List[Dict[str, Any]],
+    keep_raw: bool = False,
+    message_cls: type = WebhookMessage
+) -> List[WebhookMessage]:
+    """
+    Parse webhook results column by column into message_cls objects
+    (WebhookMessage or WebhookMessageTuple).
+    
+    Each field is extracted for the whole batch with a list comprehension
+    before the messages are built, keeping per-record interpreter overhead
+    low. Raises on the first malformed record.
+    """
+    # Bind the nested message once instead of re-fetching it per field
+    msgs = [result.get("message") or _EMPTY for result in results]
+    types = [sys.intern(msg.get("type", "UNKNOWN").lower()) for msg in msgs]
+    received = [_parse_iso(result.get("receivedAt")) for result in results]
+    contacts = [(result.get("contact") or _EMPTY).get("name") for result in results]
+    texts = [
+        msg.get("text") if message_type == MessageTypes.TEXT else None
+        for msg, message_type in zip(msgs, types)
+    ]
+    media_urls = [
+        msg.get("url") if message_type in MessageTypes.MEDIA_TYPES else None
+        for msg, message_type in zip(msgs, types)
+    ]
+    
+    return [
+        message_cls(
+            message_id=result.get("messageId"),
+            from_number=result.get("from"),
+            to_number=result.get("to"),
+            message_type=message_type,
+            text=text,
+            media_url=media_url,
+            contact_name=contact_name,
+            received_at=received_at,
+            raw_payload=result if keep_raw else None
+        )
+        for result, message_type, text, media_url, contact_name, received_at in zip(
+            results, types, texts, media_urls, contacts, received
+        )
+    ]
+
+
+def _compute_default_response(message: str, sender_name: str) -> Tuple[str, str]:
+    """
+    Build the auto-response for the default keyword templates.
+    
+    Returns:
+        Tuple of (response_text, response_type)
+    """
+    # Empty messages can never match, so skip the lower/strip allocation
+    keyword = AutoResponseTemplates.match_keyword(message.lower().strip()) if message else None
+    if keyword is not None:
+        return (
+            AutoResponseTemplates.COMPILED_KEYWORD_RESPONSES[keyword](sender_name, message),
+            "keyword_match"
+        )
+    
+    return AutoResponseTemplates.COMPILED_DEFAULT_RESPONSE(sender_name, message), "default"
+
 
 class WhatsAppClient:
     """
@@ -156,6 +235,9 @@ class WhatsAppClient:
         self.media_dir = Path(Defaults.MEDIA_DOWNLOAD_DIR)
         self.media_dir.mkdir(exist_ok=True)
         
+        # Directories already created by this client (skips repeat mkdir calls)
+        self._ensured_dirs: Set[Path] = {self.media_dir}
+        
         # Log initialization
         if self.enable_logging:
             logger.info(f"WhatsApp client initialized - Sender: {self.sender}")
@@ -436,21 +518,27 @@ class WhatsAppClient:
                 latitude, longitude, name, address, strict=True
             )
         
-        # Prepare payload
-        payload = {
-            "from": self.sender,
-            "to": to_number,
-            "content": {
-                "latitude": latitude,
-                "longitude": longitude
-            }
+        # Prepare content
+        content = {
+            "latitude": latitude,
+            "longitude": longitude
         }
         
         # Add optional fields
         if name:
-            payload["content"]["name"] = name
+            content["name"] = name
         if address:
-            payload["content"]["address"] = address
+            content["address"] = address
+        
+        return self._send_location_content(to_number, content)
+    
+    def _send_location_content(self, to_number: str, content: Dict[str, Any]) -> MessageResponse:
+        """Send a location message with a prepared content block."""
+        payload = {
+            "from": self.sender,
+            "to": to_number,
+            "content": content
+        }
         
         try:
             # Make API request
@@ -501,16 +589,14 @@ class WhatsAppClient:
                 value=preset_name
             )
         
-        location = LEBANON_LOCATIONS[preset_name]
+        if validate_input or (validate_input is None and self.enable_validation):
+            location = LEBANON_LOCATIONS[preset_name]
+            validate_location_params(
+                location.latitude, location.longitude, location.name, location.address, strict=True
+            )
         
-        return self.send_location(
-            to_number=to_number,
-            latitude=location.latitude,
-            longitude=location.longitude,
-            name=location.name,
-            address=location.address,
-            validate_input=validate_input
-        )
+        # Send a copy of the prebuilt content so the shared preset can't be altered downstream
+        return self._send_location_content(to_number, dict(LEBANON_LOCATIONS_PAYLOAD[preset_name]))
     
     def send_template(
         self,
@@ -740,7 +826,9 @@ class WhatsAppClient:
             else:
                 save_dir = self.media_dir
             
-            save_dir.mkdir(exist_ok=True)
+            if save_dir not in self._ensured_dirs:
+                save_dir.mkdir(parents=True, exist_ok=True)
+                self._ensured_dirs.add(save_dir)
             
             if not filename:
                 # Auto-generate filename
@@ -829,7 +917,7 @@ class WhatsAppClient:
         # Prepare payload
         payload = {
             "messageId": message_id,
-            "status": "READ"
+            "status": STATUS_READ
         }
         
         try:
@@ -837,7 +925,7 @@ class WhatsAppClient:
             response = self._make_request("POST", Endpoints.MESSAGE_STATUS, payload)
             response_data = self._handle_response(response)
             
-            return StatusResponse.success_response(message_id, "READ")
+            return StatusResponse.success_response(message_id, STATUS_READ)
             
         except WhatsAppError:
             raise
@@ -886,14 +974,11 @@ class WhatsAppClient:
             if sender_number and send_response:
                 validate_phone_number(sender_number, strict=True)
         
-        # Generate response
-        response_text = self._generate_auto_response(
+        # Generate response and its type in a single keyword scan
+        response_text, response_type = self._generate_auto_response(
             incoming_message, sender_name, custom_templates
         )
         
-        # Determine response type
-        response_type = self._get_response_type(incoming_message, custom_templates)
-        
         # Create base result
         result = AutoResponseResult(
             success=True,
@@ -906,48 +991,124 @@ class WhatsAppClient:
         
         # Send response if requested and phone number provided
         if send_response and sender_number:
-            try:
-                message_response = self.send_text_message(
-                    sender_number, response_text, validate_input=False
-                )
-                
-                if message_response.success:
-                    result.message_sent = True
-                    result.message_id = message_response.message_id
-                else:
-                    result.error = f"Failed to send response: {message_response.error}"
-                    result.success = False
-                    
-            except Exception as e:
-                result.error = f"Failed to send response: {str(e)}"
-                result.success = False
+            self._send_auto_response(result)
         
         return result
     
+    def auto_respond_many(
+        self,
+        messages: List[Tuple[str, str, Optional[str]]],
+        send_response: bool = True,
+        custom_templates: Optional[Dict[str, str]] = None,
+        validate_input: Optional[bool] = None,
+        max_workers: int = 8
+    ) -> List[AutoResponseResult]:
+        """
+        Generate auto-responses for a batch of messages and send them concurrently.
+        
+        Responses are generated up front (CPU-bound), then the sends are issued
+        from a thread pool so a webhook burst isn't serialized on network I/O.
+        The pool reuses the client's blocking send path (requests, retries and
+        rate-limit handling) rather than a separate async HTTP client, so it
+        can be called from synchronous webhook handlers without an event loop.
+        
+        Args:
+            messages: List of (incoming_message, sender_name, sender_number) tuples
+            send_response: Whether to actually send the responses
+            custom_templates: Custom response templates
+            validate_input: Override default validation setting
+            max_workers: Maximum number of concurrent sends
+            
+        Returns:
+            List of AutoResponseResult, in the same order as messages
+            
+        Example:
+            results = client.auto_respond_many([
+                ("Hey there!", "Antonio", "96170895652"),
+                ("Thanks", "Maya", "96171234567")
+            ])
+        """
+        results = []
+        for incoming_message, sender_name, sender_number in messages:
+            try:
+                results.append(self.auto_respond(
+                    incoming_message,
+                    sender_name=sender_name,
+                    sender_number=sender_number,
+                    send_response=False,
+                    custom_templates=custom_templates,
+                    validate_input=validate_input
+                ))
+            except ValidationError as e:
+                results.append(AutoResponseResult(
+                    success=False,
+                    original_message=incoming_message,
+                    sender_name=sender_name,
+                    sender_number=sender_number,
+                    error=str(e)
+                ))
+        
+        if send_response:
+            pending = [result for result in results if result.success and result.sender_number]
+            if pending:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+                    list(executor.map(self._send_auto_response, pending))
+        
+        return results
+    
+    def _send_auto_response(self, result: AutoResponseResult) -> None:
+        """Send a generated auto-response and record the outcome on the result."""
+        try:
+            message_response = self.send_text_message(
+                result.sender_number, result.response_text, validate_input=False
+            )
+            
+            if message_response.success:
+                result.message_sent = True
+                result.message_id = message_response.message_id
+            else:
+                result.error = f"Failed to send response: {message_response.error}"
+                result.success = False
+                
+        except Exception as e:
+            result.error = f"Failed to send response: {str(e)}"
+            result.success = False
+    
     def _generate_auto_response(
         self,
         message: str,
         sender_name: str,
         custom_templates: Optional[Dict[str, str]] = None
-    ) -> str:
-        """Generate auto-response text based on incoming message."""
-        message_lower = message.lower().strip()
+    ) -> Tuple[str, str]:
+        """
+        Generate auto-response text and type based on incoming message.
+        
+        Returns:
+            Tuple of (response_text, response_type)
+        """
+        # Default templates go through the precompiled keyword scanner
+        if not custom_templates:
+            return _compute_default_response(message, sender_name)
         
-        # Use custom templates if provided, otherwise use defaults
-        templates = custom_templates or AutoResponseTemplates.KEYWORD_RESPONSES
+        message_lower = message.lower().strip()
+        templates = custom_templates
         
         # Check for exact matches first
         if message_lower in templates:
-            return templates[message_lower].format(name=sender_name, message=message)
+            return (
+                templates[message_lower].format(name=sender_name, message=message),
+                "keyword_match"
+            )
         
         # Check for partial matches
         for keyword, template in templates.items():
             if keyword in message_lower:
-                return template.format(name=sender_name, message=message)
+                return template.format(name=sender_name, message=message), "keyword_match"
         
         # Default response
-        return AutoResponseTemplates.DEFAULT_RESPONSE.format(
-            name=sender_name, message=message
+        return (
+            AutoResponseTemplates.DEFAULT_RESPONSE.format(name=sender_name, message=message),
+            "default"
         )
     
     def _get_response_type(
@@ -956,19 +1117,9 @@ class WhatsAppClient:
         custom_templates: Optional[Dict[str, str]] = None
     ) -> str:
         """Determine the type of auto-response generated."""
-        message_lower = message.lower().strip()
-        templates = custom_templates or AutoResponseTemplates.KEYWORD_RESPONSES
-        
-        # Check for exact match
-        if message_lower in templates:
-            return "keyword_match"
-        
-        # Check for partial match
-        for keyword in templates.keys():
-            if keyword in message_lower:
-                return "keyword_match"
-        
-        return "default"
+        return self._generate_auto_response(
+            message, Defaults.AUTO_RESPONSE_SENDER_NAME, custom_templates
+        )[1]
     
     def get_client_info(self) -> Dict[str, Any]:
         """
@@ -988,44 +1139,55 @@ class WhatsAppClient:
             "available_presets": list(LEBANON_LOCATIONS.keys())
         }
     
-    def parse_webhook_payload(self, payload: Dict[str, Any]) -> List["WebhookMessage"]:
+    def parse_webhook_payload(
+        self,
+        payload: Dict[str, Any],
+        keep_raw: bool = False,
+        as_tuples: bool = False
+    ) -> List[Union["WebhookMessage", "WebhookMessageTuple"]]:
         """
         Parse incoming webhook payload into a list of WebhookMessage objects.
         
         Args:
             payload: The raw webhook payload from Infobip
+            keep_raw: Attach each original result dict as raw_payload. Off by
+                default so parsed messages don't keep the whole payload alive;
+                use WebhookMessage.to_payload() to rebuild the consumed fields.
+            as_tuples: Return lightweight read-only WebhookMessageTuple objects
+                instead, for routing paths that only read the fields.
             
         Returns:
-            A list of parsed WebhookMessage objects
+            A list of parsed WebhookMessage (or WebhookMessageTuple) objects
         """
         messages = []
+        message_cls = WebhookMessageTuple if as_tuples else WebhookMessage
         
         if "results" not in payload:
             logger.warning("Webhook payload missing 'results' key")
             return messages
         
+        # Cheap precheck instead of exception handling for the common case:
+        # records without a timestamp can never be parsed
+        valid = []
+        failed = []
         for result in payload["results"]:
-            try:
-                message_type = result.get("message", {}).get("type", "UNKNOWN").lower()
-                
-                message = WebhookMessage(
-                    message_id=result.get("messageId"),
-                    from_number=result.get("from"),
-                    to_number=result.get("to"),
-                    message_type=message_type,
-                    contact_name=result.get("contact", {}).get("name"),
-                    received_at=datetime.fromisoformat(result.get("receivedAt")),
-                    raw_payload=result
-                )
-                
-                if message_type == "text":
-                    message.text = result.get("message", {}).get("text")
-                elif message_type in ["image", "video", "audio", "document"]:
-                    message.media_url = result.get("message", {}).get("url")
-                
-                messages.append(message)
-                
-            except Exception as e:
-                logger.error(f"Error parsing webhook message: {e} | Payload: {result}")
+            if isinstance(result, dict) and result.get("receivedAt"):
+                valid.append(result)
+            else:
+                failed.append(result)
+        
+        # Fast path: parse the whole batch column-wise in one go
+        try:
+            messages = _parse_webhook_batch(valid, keep_raw, message_cls)
+        except Exception:
+            # A timestamp is malformed; parse one by one so the valid ones survive
+            for result in valid:
+                try:
+                    messages.extend(_parse_webhook_batch([result], keep_raw, message_cls))
+                except Exception:
+                    failed.append(result)
+        
+        if failed:
+            logger.error(f"Error parsing {len(failed)} webhook message(s) | Payloads: {failed}")
         
         return messages 
\ No newline at end of file
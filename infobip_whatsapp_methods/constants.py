@@ -5,7 +5,11 @@ This module contains all API endpoints, default values, supported formats,
 and other constants used throughout the SDK.
 """
 
-from typing import List, Dict, Set
+import re
+import string
+import sys
+from types import MappingProxyType
+from typing import Callable, List, Dict, Set, FrozenSet, Mapping, Optional, Pattern, Tuple
 
 # API Configuration
 DEFAULT_TIMEOUT = 30  # seconds
@@ -75,26 +79,23 @@ class MediaTypes:
     # All supported formats
     ALL_FORMATS = IMAGE_FORMATS | VIDEO_FORMATS | AUDIO_FORMATS | DOCUMENT_FORMATS
     
+    # Content type -> media category, resolved with a single lookup
+    _CATEGORY_MAP: Dict[str, str] = {
+        **dict.fromkeys(IMAGE_FORMATS, sys.intern("image")),
+        **dict.fromkeys(VIDEO_FORMATS, sys.intern("video")),
+        **dict.fromkeys(AUDIO_FORMATS, sys.intern("audio")),
+        **dict.fromkeys(DOCUMENT_FORMATS, sys.intern("document"))
+    }
+    
     @classmethod
     def is_supported_format(cls, content_type: str) -> bool:
         """Check if content type is supported."""
-        return content_type.lower() in cls.ALL_FORMATS
+        return content_type.lower() in cls._CATEGORY_MAP
     
     @classmethod
     def get_media_type(cls, content_type: str) -> str:
         """Get media type category from content type."""
-        content_type = content_type.lower()
-        
-        if content_type in cls.IMAGE_FORMATS:
-            return "image"
-        elif content_type in cls.VIDEO_FORMATS:
-            return "video"
-        elif content_type in cls.AUDIO_FORMATS:
-            return "audio"
-        elif content_type in cls.DOCUMENT_FORMATS:
-            return "document"
-        else:
-            return "unknown"
+        return cls._CATEGORY_MAP.get(content_type.lower(), "unknown")
 
 # File Size Limits (in bytes)
 class FileLimits:
@@ -126,12 +127,53 @@ class MessageLimits:
     MAX_LOCATION_ADDRESS_LENGTH = 1000 # Maximum location address length
     MAX_TEMPLATE_VARIABLES = 10   # Maximum template variables
 
+def _build_pair_index(keywords) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """Group keywords by their two-character prefix, preserving keyword order."""
+    index: Dict[str, List[str]] = {}
+    for keyword in keywords:
+        index.setdefault(keyword[:2], []).append(keyword)
+    return tuple((pair, tuple(group)) for pair, group in index.items())
+
+def _compile_template(template: str) -> Callable[[str, str], str]:
+    """
+    Pre-parse a {name}/{message} template into a render function.
+    
+    The template is split into literal and field segments once, so rendering
+    is plain string concatenation. Field values are formatted the way
+    str.format would, so None or non-str names render the same. Templates
+    using any other field, format spec or conversion fall back to str.format.
+    """
+    literals: List[str] = []
+    fields: List[bool] = []
+    
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        literals.append(literal)
+        if field is None:
+            break
+        if field not in ("name", "message") or spec or conversion:
+            return lambda name, message: template.format(name=name, message=message)
+        fields.append(field == "message")
+    
+    if len(literals) == len(fields):
+        literals.append("")
+    
+    head = literals[0]
+    tail = tuple(zip(fields, literals[1:]))
+    
+    def render(name: str, message: str) -> str:
+        out = head
+        for is_message, literal in tail:
+            out += f"{message if is_message else name}{literal}"
+        return out
+    
+    return render
+
 # Auto-Response Templates
 class AutoResponseTemplates:
     """Default auto-response templates."""
     
     # Keyword-based responses
-    KEYWORD_RESPONSES: Dict[str, str] = {
+    KEYWORD_RESPONSES: Mapping[str, str] = MappingProxyType({
         "hey": "Hey {name}! 👋 Thanks for reaching out. How can I assist you today?",
         "hello": "Hello {name}! 😊 Nice to hear from you. What can I help you with?",
         "hi": "Hi {name}! 👋 Great to connect with you. How may I help?",
@@ -144,7 +186,48 @@ class AutoResponseTemplates:
         "good evening": "Good evening, {name}! 🌙 How may I help you this evening?",
         "bye": "Goodbye, {name}! 👋 Feel free to reach out anytime if you need assistance.",
         "goodbye": "Take care, {name}! 😊 Don't hesitate to contact us if you need anything."
-    }
+    })
+    
+    # Frozen keyword index and length bounds for fast exact/short-message checks
+    KEYWORD_RESPONSE_KEYS: FrozenSet[str] = frozenset(KEYWORD_RESPONSES)
+    _MIN_KEYWORD_LEN: int = min(map(len, KEYWORD_RESPONSES))
+    _MAX_KEYWORD_LEN: int = max(map(len, KEYWORD_RESPONSES))
+    
+    # Two-character prefix index: each unique keyword prefix maps to its
+    # keywords in priority order, so a message only pays for full keyword
+    # comparisons when the prefix itself occurs in it.
+    _PAIR_INDEX: Tuple[Tuple[str, Tuple[str, ...]], ...] = _build_pair_index(KEYWORD_RESPONSES)
+    _KEYWORD_RANK: Dict[str, int] = dict(
+        zip(KEYWORD_RESPONSES, range(len(KEYWORD_RESPONSES)))
+    )
+    
+    @classmethod
+    def match_keyword(cls, message_lower: str) -> Optional[str]:
+        """
+        Find the default keyword that applies to a lowercased message.
+        
+        Exact matches win; otherwise the first keyword (in KEYWORD_RESPONSES
+        order) contained in the message is returned, or None if none match.
+        """
+        # Too short to contain any keyword
+        if len(message_lower) < cls._MIN_KEYWORD_LEN:
+            return None
+        
+        if len(message_lower) <= cls._MAX_KEYWORD_LEN and message_lower in cls.KEYWORD_RESPONSE_KEYS:
+            return message_lower
+        
+        rank = cls._KEYWORD_RANK
+        best = None
+        for pair, keywords in cls._PAIR_INDEX:
+            if pair not in message_lower:
+                continue
+            for keyword in keywords:
+                if keyword in message_lower:
+                    if best is None or rank[keyword] < rank[best]:
+                        best = keyword
+                    break
+        
+        return best
     
     # Default response when no keyword matches
     DEFAULT_RESPONSE = "Thanks for your message, {name}! 📱 I received: '{message}'. Our team will get back to you soon!"
@@ -154,6 +237,13 @@ class AutoResponseTemplates:
     
     # Error response
     ERROR_RESPONSE = "We apologize, {name}, but we're experiencing technical difficulties. Please try again later or contact our support team directly."
+    
+    # Pre-parsed render functions: render(name, message) -> str
+    COMPILED_KEYWORD_RESPONSES: Dict[str, Callable[[str, str], str]] = {
+        keyword: _compile_template(template)
+        for keyword, template in KEYWORD_RESPONSES.items()
+    }
+    COMPILED_DEFAULT_RESPONSE: Callable[[str, str], str] = _compile_template(DEFAULT_RESPONSE)
 
 # Rate Limiting Configuration
 class RateLimitConfig:
@@ -201,6 +291,26 @@ class ValidationPatterns:
     
     # Email pattern (basic)
     EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    
+    # Compiled patterns (compiled once at import, reused by every validation)
+    PHONE_NUMBER_RE: Pattern[str] = re.compile(PHONE_NUMBER_PATTERN)
+    PHONE_NUMBER_SIMPLE_RE: Pattern[str] = re.compile(PHONE_NUMBER_SIMPLE_PATTERN)
+    HTTP_URL_RE: Pattern[str] = re.compile(HTTP_URL_PATTERN)
+    HTTPS_URL_RE: Pattern[str] = re.compile(HTTPS_URL_PATTERN)
+    EMAIL_RE: Pattern[str] = re.compile(EMAIL_PATTERN)
+    
+    @classmethod
+    def is_e164(cls, phone_number: str) -> bool:
+        """
+        Check a phone number against the E.164 format.
+        
+        Plain ASCII digit strings are decided with str methods alone; anything
+        else falls back to PHONE_NUMBER_RE.
+        """
+        digits = phone_number[1:] if phone_number.startswith("+") else phone_number
+        if 2 <= len(digits) <= 15 and digits.isascii() and digits.isdigit():
+            return digits[0] != "0"
+        return cls.PHONE_NUMBER_RE.match(phone_number) is not None
 
 # Environment Variable Names
 class EnvVars:
@@ -238,21 +348,22 @@ class LogConfig:
 class Headers:
     """Standard HTTP headers used by the SDK."""
     
-    AUTHORIZATION = "Authorization"
-    CONTENT_TYPE = "Content-Type"
-    ACCEPT = "Accept"
-    USER_AGENT = "User-Agent"
+    # Header names are interned since they are used as dict keys on every request
+    AUTHORIZATION = sys.intern("Authorization")
+    CONTENT_TYPE = sys.intern("Content-Type")
+    ACCEPT = sys.intern("Accept")
+    USER_AGENT = sys.intern("User-Agent")
     
     # Content types
     JSON_CONTENT_TYPE = "application/json"
     FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
     
-    # Default headers
-    DEFAULT_HEADERS = {
+    # Default headers (read-only and shared; merge into a new dict to extend)
+    DEFAULT_HEADERS: Mapping[str, str] = MappingProxyType({
         CONTENT_TYPE: JSON_CONTENT_TYPE,
         ACCEPT: JSON_CONTENT_TYPE,
         USER_AGENT: "infobip-whatsapp-methods-sdk/1.0.0"
-    }
+    })
 
 # Status Codes
 class StatusCodes:
@@ -284,17 +395,21 @@ class StatusCodes:
 class MessageTypes:
     """WhatsApp message types."""
     
-    TEXT = "text"
-    IMAGE = "image" 
-    VIDEO = "video"
-    AUDIO = "audio"
-    DOCUMENT = "document"
-    LOCATION = "location"
-    CONTACT = "contact"
-    TEMPLATE = "template"
+    # Interned so parsed webhook types compare and hash by identity
+    TEXT = sys.intern("text")
+    IMAGE = sys.intern("image")
+    VIDEO = sys.intern("video")
+    AUDIO = sys.intern("audio")
+    DOCUMENT = sys.intern("document")
+    LOCATION = sys.intern("location")
+    CONTACT = sys.intern("contact")
+    TEMPLATE = sys.intern("template")
     
     # All supported types
-    ALL_TYPES = {TEXT, IMAGE, VIDEO, AUDIO, DOCUMENT, LOCATION, CONTACT, TEMPLATE}
+    ALL_TYPES: FrozenSet[str] = frozenset({TEXT, IMAGE, VIDEO, AUDIO, DOCUMENT, LOCATION, CONTACT, TEMPLATE})
+    
+    # Types that carry a media URL
+    MEDIA_TYPES: FrozenSet[str] = frozenset({IMAGE, VIDEO, AUDIO, DOCUMENT})
 
 # Template Button Types
 class TemplateButtonTypes:
@@ -5,7 +5,8 @@ This module defines a comprehensive exception hierarchy for handling
 different types of errors that can occur when using the Infobip WhatsApp API.
 """
 
-from typing import Optional, Dict, Any, List
+import sys
+from typing import Optional, Dict, Any, List, Tuple
 
 
 class WhatsAppError(Exception):
@@ -31,8 +32,17 @@ class WhatsAppError(Exception):
         self.status_code = status_code
         self.error_code = error_code
         self.details = details or {}
+        self._str_cache: Optional[str] = None
     
     def __str__(self):
+        # Attributes are treated as immutable after construction, so the
+        # rendered string is built once and reused by repeated logging.
+        if self._str_cache is None:
+            self._str_cache = " | ".join(self._str_parts())
+        return self._str_cache
+    
+    def _str_parts(self) -> List[str]:
+        """Collect the segments rendered by __str__; subclasses extend this."""
         error_parts = [f"WhatsAppError: {self.message}"]
         
         if self.status_code:
@@ -44,7 +54,7 @@ class WhatsAppError(Exception):
         if self.details:
             error_parts.append(f"Details: {self.details}")
         
-        return " | ".join(error_parts)
+        return error_parts
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for logging/serialization."""
@@ -91,13 +101,13 @@ class RateLimitError(WhatsAppError):
         self.retry_after = retry_after
         self.quota_exceeded = quota_exceeded
     
-    def __str__(self):
-        base_str = super().__str__()
+    def _str_parts(self) -> List[str]:
+        error_parts = super()._str_parts()
         if self.retry_after:
-            base_str += f" | Retry After: {self.retry_after}s"
+            error_parts.append(f"Retry After: {self.retry_after}s")
         if self.quota_exceeded:
-            base_str += " | Quota Exceeded"
-        return base_str
+            error_parts.append("Quota Exceeded")
+        return error_parts
 
 
 class ValidationError(WhatsAppError):
@@ -111,7 +121,7 @@ class ValidationError(WhatsAppError):
     - Message content violates constraints
     
     Attributes:
-        field (Optional[str]): The field that failed validation
+        field (Optional[str]): The field that failed validation (interned)
         value (Any): The invalid value
         validation_errors (List[str]): List of validation error messages
     """
@@ -125,19 +135,19 @@ class ValidationError(WhatsAppError):
         **kwargs
     ):
         super().__init__(message, **kwargs)
-        self.field = field
+        self.field = sys.intern(field) if field is not None else None
         self.value = value
         self.validation_errors = validation_errors or []
     
-    def __str__(self):
-        base_str = super().__str__()
+    def _str_parts(self) -> List[str]:
+        error_parts = super()._str_parts()
         if self.field:
-            base_str += f" | Field: {self.field}"
+            error_parts.append(f"Field: {self.field}")
         if self.value is not None:
-            base_str += f" | Value: {self.value}"
+            error_parts.append(f"Value: {self.value}")
         if self.validation_errors:
-            base_str += f" | Validation Errors: {', '.join(self.validation_errors)}"
-        return base_str
+            error_parts.append(f"Validation Errors: {', '.join(self.validation_errors)}")
+        return error_parts
 
 
 class NetworkError(WhatsAppError):
@@ -177,11 +187,11 @@ class APIError(WhatsAppError):
         self.api_response = api_response
         self.user_errors = user_errors or []
     
-    def __str__(self):
-        base_str = super().__str__()
+    def _str_parts(self) -> List[str]:
+        error_parts = super()._str_parts()
         if self.user_errors:
-            base_str += f" | User Errors: {', '.join(self.user_errors)}"
-        return base_str
+            error_parts.append(f"User Errors: {', '.join(self.user_errors)}")
+        return error_parts
 
 
 class MediaError(WhatsAppError):
@@ -198,7 +208,7 @@ class MediaError(WhatsAppError):
     Attributes:
         media_url (Optional[str]): The media URL that caused the error
         file_size (Optional[int]): File size in bytes if known
-        content_type (Optional[str]): Media content type if known
+        content_type (Optional[str]): Media content type if known (interned)
     """
     
     def __init__(
@@ -212,17 +222,17 @@ class MediaError(WhatsAppError):
         super().__init__(message, **kwargs)
         self.media_url = media_url
         self.file_size = file_size
-        self.content_type = content_type
+        self.content_type = sys.intern(content_type) if content_type is not None else None
     
-    def __str__(self):
-        base_str = super().__str__()
+    def _str_parts(self) -> List[str]:
+        error_parts = super()._str_parts()
         if self.media_url:
-            base_str += f" | Media URL: {self.media_url}"
+            error_parts.append(f"Media URL: {self.media_url}")
         if self.file_size:
-            base_str += f" | File Size: {self.file_size} bytes"
+            error_parts.append(f"File Size: {self.file_size} bytes")
         if self.content_type:
-            base_str += f" | Content Type: {self.content_type}"
-        return base_str
+            error_parts.append(f"Content Type: {self.content_type}")
+        return error_parts
 
 
 class TemplateError(WhatsAppError):
@@ -236,7 +246,7 @@ class TemplateError(WhatsAppError):
     - Invalid template data
     
     Attributes:
-        template_name (Optional[str]): Name of the template
+        template_name (Optional[str]): Name of the template (interned)
         variables_provided (Optional[int]): Number of variables provided
         variables_expected (Optional[int]): Number of variables expected
     """
@@ -250,17 +260,17 @@ class TemplateError(WhatsAppError):
         **kwargs
     ):
         super().__init__(message, **kwargs)
-        self.template_name = template_name
+        self.template_name = sys.intern(template_name) if template_name is not None else None
         self.variables_provided = variables_provided
         self.variables_expected = variables_expected
     
-    def __str__(self):
-        base_str = super().__str__()
+    def _str_parts(self) -> List[str]:
+        error_parts = super()._str_parts()
         if self.template_name:
-            base_str += f" | Template: {self.template_name}"
+            error_parts.append(f"Template: {self.template_name}")
         if self.variables_provided is not None and self.variables_expected is not None:
-            base_str += f" | Variables: {self.variables_provided}/{self.variables_expected}"
-        return base_str
+            error_parts.append(f"Variables: {self.variables_provided}/{self.variables_expected}")
+        return error_parts
 
 
 # Exception mapping for HTTP status codes
@@ -277,6 +287,97 @@ HTTP_STATUS_TO_EXCEPTION = {
 }
 
 
+def _extract_error_fields(
+    response_data: Optional[Dict[str, Any]],
+    default_message: str
+) -> Tuple[str, Optional[str], List[str]]:
+    """
+    Extract message, error code and user errors from an API error response.
+    
+    Returns:
+        Tuple of (message, error_code, user_errors)
+    """
+    message = default_message
+    error_code = None
+    user_errors = []
+    
+    if not response_data or not isinstance(response_data, dict):
+        return message, error_code, user_errors
+    
+    # Format 1: Direct error message
+    if "error" in response_data:
+        message = str(response_data["error"])
+    
+    # Format 2: Infobip API error format
+    elif "requestError" in response_data:
+        error_info = response_data["requestError"]
+        if "serviceException" in error_info:
+            service_error = error_info["serviceException"]
+            message = service_error.get("text", message)
+            error_code = service_error.get("messageId")
+            
+            # Extract validation errors
+            if "validationErrors" in service_error:
+                user_errors = [
+                    f"{err.get('field', 'unknown')}: {err.get('message', 'validation failed')}"
+                    for err in service_error["validationErrors"]
+                ]
+    
+    # Format 3: User errors array
+    elif "userErrors" in response_data:
+        user_errors = [
+            error.get("message", "Unknown error")
+            for error in response_data["userErrors"]
+        ]
+        if user_errors:
+            message = "; ".join(user_errors)
+    
+    return message, error_code, user_errors
+
+
+def _build_rate_limit_kwargs(message, status_code, error_code, response_data, user_errors):
+    """Constructor arguments for RateLimitError."""
+    retry_after = None
+    if response_data and isinstance(response_data, dict):
+        retry_after = response_data.get("retryAfter")
+    
+    return {
+        "message": message,
+        "status_code": status_code,
+        "error_code": error_code,
+        "retry_after": retry_after,
+        "details": {"user_errors": user_errors} if user_errors else None
+    }
+
+
+def _build_api_kwargs(message, status_code, error_code, response_data, user_errors):
+    """Constructor arguments for APIError."""
+    return {
+        "message": message,
+        "status_code": status_code,
+        "error_code": error_code,
+        "api_response": response_data,
+        "user_errors": user_errors
+    }
+
+
+def _build_default_kwargs(message, status_code, error_code, response_data, user_errors):
+    """Constructor arguments for every other WhatsAppError subclass."""
+    return {
+        "message": message,
+        "status_code": status_code,
+        "error_code": error_code,
+        "details": {"user_errors": user_errors} if user_errors else None
+    }
+
+
+# Exception class -> constructor kwargs builder
+_EXC_BUILDERS = {
+    RateLimitError: _build_rate_limit_kwargs,
+    APIError: _build_api_kwargs,
+}
+
+
 def create_exception_from_response(
     status_code: int,
     response_data: Optional[Dict[str, Any]] = None,
@@ -293,72 +394,11 @@ def create_exception_from_response(
     Returns:
         Appropriate WhatsAppError subclass instance
     """
-    # Extract error details from response
-    message = default_message
-    error_code = None
-    user_errors = []
-    
-    if response_data:
-        # Try to extract error message from various response formats
-        if isinstance(response_data, dict):
-            # Format 1: Direct error message
-            if "error" in response_data:
-                message = str(response_data["error"])
-            
-            # Format 2: Infobip API error format
-            elif "requestError" in response_data:
-                error_info = response_data["requestError"]
-                if "serviceException" in error_info:
-                    service_error = error_info["serviceException"]
-                    message = service_error.get("text", message)
-                    error_code = service_error.get("messageId")
-                    
-                    # Extract validation errors
-                    if "validationErrors" in service_error:
-                        user_errors = [
-                            f"{err.get('field', 'unknown')}: {err.get('message', 'validation failed')}"
-                            for err in service_error["validationErrors"]
-                        ]
-            
-            # Format 3: User errors array
-            elif "userErrors" in response_data:
-                user_errors = [
-                    error.get("message", "Unknown error")
-                    for error in response_data["userErrors"]
-                ]
-                if user_errors:
-                    message = "; ".join(user_errors)
+    message, error_code, user_errors = _extract_error_fields(response_data, default_message)
     
-    # Get appropriate exception class
     exception_class = HTTP_STATUS_TO_EXCEPTION.get(status_code, APIError)
+    build_kwargs = _EXC_BUILDERS.get(exception_class, _build_default_kwargs)
     
-    # Create exception with appropriate parameters
-    if exception_class == RateLimitError:
-        retry_after = None
-        if response_data and isinstance(response_data, dict):
-            retry_after = response_data.get("retryAfter")
-        
-        return exception_class(
-            message=message,
-            status_code=status_code,
-            error_code=error_code,
-            retry_after=retry_after,
-            details={"user_errors": user_errors} if user_errors else None
-        )
-    
-    elif exception_class == APIError:
-        return exception_class(
-            message=message,
-            status_code=status_code,
-            error_code=error_code,
-            api_response=response_data,
-            user_errors=user_errors
-        )
-    
-    else:
-        return exception_class(
-            message=message,
-            status_code=status_code,
-            error_code=error_code,
-            details={"user_errors": user_errors} if user_errors else None
-        ) 
\ No newline at end of file
+    return exception_class(
+        **build_kwargs(message, status_code, error_code, response_data, user_errors)
+    )
@@ -5,31 +5,83 @@ This module defines standardized response models for all API operations,
 providing type-safe and consistent data structures.
 """
 
+import json
+import math
+import sys
+from array import array
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Final, NamedTuple, Tuple
 from enum import Enum
 
 
+# Plain string constants for hot paths; the Enums below wrap the same values
+STATUS_PENDING: Final[str] = sys.intern("PENDING")
+STATUS_PENDING_ENROUTE: Final[str] = sys.intern("PENDING_ENROUTE")
+STATUS_DELIVERED: Final[str] = sys.intern("DELIVERED")
+STATUS_READ: Final[str] = sys.intern("READ")
+STATUS_FAILED: Final[str] = sys.intern("FAILED")
+STATUS_REJECTED: Final[str] = sys.intern("REJECTED")
+
+MEDIA_TYPE_IMAGE: Final[str] = sys.intern("image")
+MEDIA_TYPE_DOCUMENT: Final[str] = sys.intern("document")
+MEDIA_TYPE_VIDEO: Final[str] = sys.intern("video")
+MEDIA_TYPE_AUDIO: Final[str] = sys.intern("audio")
+
+
 class MessageStatus(Enum):
     """Enumeration of possible message statuses."""
-    PENDING = "PENDING"
-    PENDING_ENROUTE = "PENDING_ENROUTE"
-    DELIVERED = "DELIVERED"
-    READ = "READ"
-    FAILED = "FAILED"
-    REJECTED = "REJECTED"
+    PENDING = STATUS_PENDING
+    PENDING_ENROUTE = STATUS_PENDING_ENROUTE
+    DELIVERED = STATUS_DELIVERED
+    READ = STATUS_READ
+    FAILED = STATUS_FAILED
+    REJECTED = STATUS_REJECTED
 
 
 class MediaType(Enum):
     """Enumeration of supported media types."""
-    IMAGE = "image"
-    DOCUMENT = "document"
-    VIDEO = "video"
-    AUDIO = "audio"
+    IMAGE = MEDIA_TYPE_IMAGE
+    DOCUMENT = MEDIA_TYPE_DOCUMENT
+    VIDEO = MEDIA_TYPE_VIDEO
+    AUDIO = MEDIA_TYPE_AUDIO
+
+
+# Canonical (interned) status and media type strings
+_INTERNED_STATUS: Dict[str, str] = {s.value: s.value for s in MessageStatus}
+_INTERNED_MEDIA_TYPE: Dict[str, str] = {m.value: m.value for m in MediaType}
+_MEDIA_MESSAGE_TYPES = frozenset(_INTERNED_MEDIA_TYPE.values())
+_TEXT_MESSAGE_TYPE = sys.intern("text")
+
+
+_BYTES_PER_MB = 1024 * 1024
+
+
+def _bytes_to_mb(size: int) -> float:
+    """Convert bytes to megabytes rounded to 2 decimals using integer arithmetic."""
+    hundredths, remainder = divmod(size * 100, _BYTES_PER_MB)
+    # Ties go to the even hundredth, matching round(size / _BYTES_PER_MB, 2)
+    if remainder * 2 > _BYTES_PER_MB or (remainder * 2 == _BYTES_PER_MB and hundredths & 1):
+        hundredths += 1
+    return hundredths / 100
+
+
+def _json_default(value: Any) -> Any:
+    """JSON fallback for values nested in response metadata."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 
+def _dumps_compact(data: Dict[str, Any]) -> bytes:
+    """Serialize a response dict to compact UTF-8 JSON bytes."""
+    return json.dumps(
+        data, separators=(",", ":"), ensure_ascii=False, default=_json_default
+    ).encode("utf-8")
 
-@dataclass
+
+@dataclass(slots=True)
 class MessageResponse:
     """
     Standardized response for message sending operations.
@@ -47,15 +99,21 @@ class MessageResponse:
     message_id: Optional[str] = None
     status: str = ""
     error: Optional[str] = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: Optional[datetime] = None
     api_cost: Optional[int] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    def __post_init__(self) -> None:
+        # A caller-supplied timestamp is kept as-is (including tzinfo); the
+        # clock is only read when none was given
+        if self.timestamp is None:
+            self.timestamp = datetime.now()
+    
     @classmethod
     def success_response(
         cls,
         message_id: str,
-        status: str = "PENDING_ENROUTE",
+        status: str = STATUS_PENDING_ENROUTE,
         api_cost: Optional[int] = None,
         **metadata
     ) -> "MessageResponse":
@@ -63,7 +121,7 @@ class MessageResponse:
         return cls(
             success=True,
             message_id=message_id,
-            status=status,
+            status=_INTERNED_STATUS.get(status, status),
             api_cost=api_cost,
             metadata=metadata
         )
@@ -76,14 +134,16 @@ class MessageResponse:
         **metadata
     ) -> "MessageResponse":
         """Create an error response."""
-        return cls(
-            success=False,
-            error=error,
-            metadata={"status_code": status_code, **metadata} if status_code else metadata
-        )
+        # **metadata is always a fresh dict owned by this call, so it can be
+        # updated in place instead of copied into a new one
+        if status_code:
+            metadata["status_code"] = status_code
+        return cls(success=False, error=error, metadata=metadata)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
+        # Kept as a straight-line literal (one BUILD_CONST_KEY_MAP) rather
+        # than a generic walk over dataclass fields
         return {
             "success": self.success,
             "message_id": self.message_id,
@@ -93,9 +153,13 @@ class MessageResponse:
             "api_cost": self.api_cost,
             "metadata": self.metadata
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact UTF-8 JSON."""
+        return _dumps_compact(self.to_dict())
 
 
-@dataclass 
+@dataclass(slots=True)
 class MediaMetadataResponse:
     """
     Response for media metadata operations.
@@ -120,16 +184,23 @@ class MediaMetadataResponse:
     url: Optional[str] = None
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _media_kind: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Top-level MIME type ("image", "video", ...) is resolved once here;
+        # content_type is treated as immutable after construction.
+        kind, slash, _ = (self.content_type or "").partition("/")
+        self._media_kind = _INTERNED_MEDIA_TYPE.get(kind, "") if slash else ""
     
     @classmethod
     def from_headers(cls, headers: Dict[str, str], url: str) -> "MediaMetadataResponse":
         """Create response from HTTP headers."""
-        content_length = None
-        if "content-length" in headers:
-            try:
-                content_length = int(headers["content-length"])
-            except (ValueError, TypeError):
-                pass
+        raw_length = headers.get("content-length")
+        content_length = (
+            int(raw_length)
+            if raw_length and raw_length.isascii() and raw_length.isdigit()
+            else None
+        )
         
         return cls(
             success=True,
@@ -145,26 +216,26 @@ class MediaMetadataResponse:
     def file_size_mb(self) -> Optional[float]:
         """Get file size in megabytes."""
         if self.content_length:
-            return round(self.content_length / (1024 * 1024), 2)
+            return _bytes_to_mb(self.content_length)
         return None
     
     @property
     def is_image(self) -> bool:
         """Check if the media is an image."""
-        return bool(self.content_type and self.content_type.startswith("image/"))
+        return self._media_kind is MEDIA_TYPE_IMAGE
     
     @property
     def is_video(self) -> bool:
         """Check if the media is a video."""
-        return bool(self.content_type and self.content_type.startswith("video/"))
+        return self._media_kind is MEDIA_TYPE_VIDEO
     
     @property
     def is_audio(self) -> bool:
         """Check if the media is audio."""
-        return bool(self.content_type and self.content_type.startswith("audio/"))
+        return self._media_kind is MEDIA_TYPE_AUDIO
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaDownloadResponse:
     """
     Response for media download operations.
@@ -194,16 +265,18 @@ class MediaDownloadResponse:
     def file_size_mb(self) -> Optional[float]:
         """Get file size in megabytes."""
         if self.file_size:
-            return round(self.file_size / (1024 * 1024), 2)
+            return _bytes_to_mb(self.file_size)
         return None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
+        file_size = self.file_size
+        # Straight-line literal, see MessageResponse.to_dict
         return {
             "success": self.success,
             "file_path": self.file_path,
-            "file_size": self.file_size,
-            "file_size_mb": self.file_size_mb,
+            "file_size": file_size,
+            "file_size_mb": _bytes_to_mb(file_size) if file_size else None,
             "content_type": self.content_type,
             "filename": self.filename,
             "url": self.url,
@@ -211,9 +284,13 @@ class MediaDownloadResponse:
             "download_time": self.download_time,
             "metadata": self.metadata
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact UTF-8 JSON."""
+        return _dumps_compact(self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusResponse:
     """
     Response for message status operations.
@@ -230,20 +307,24 @@ class StatusResponse:
     message_id: Optional[str] = None
     status: Optional[str] = None
     error: Optional[str] = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: Optional[datetime] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    def __post_init__(self) -> None:
+        if self.timestamp is None:
+            self.timestamp = datetime.now()
+    
     @classmethod
-    def success_response(cls, message_id: str, status: str = "READ") -> "StatusResponse":
+    def success_response(cls, message_id: str, status: str = STATUS_READ) -> "StatusResponse":
         """Create a successful status response."""
         return cls(
             success=True,
             message_id=message_id,
-            status=status
+            status=_INTERNED_STATUS.get(status, status)
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoResponseResult:
     """
     Result of auto-response generation and sending.
@@ -310,7 +391,7 @@ class AutoResponseResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WebhookMessage:
     """
     Parsed message from webhook payload.
@@ -323,8 +404,8 @@ class WebhookMessage:
         text: Message text content (for text messages)
         media_url: URL of media content (for media messages)
         contact_name: Name of the sender (if available)
-        received_at: When the message was received
-        raw_payload: Original webhook payload
+        received_at: When the message was received (the webhook's receivedAt)
+        raw_payload: Original webhook payload (only kept when requested)
     """
     message_id: str
     from_number: str
@@ -333,26 +414,92 @@ class WebhookMessage:
     text: Optional[str] = None
     media_url: Optional[str] = None
     contact_name: Optional[str] = None
-    received_at: datetime = field(default_factory=datetime.now)
+    received_at: Optional[datetime] = None
     raw_payload: Optional[Dict[str, Any]] = None
+    _type_lower: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Lowercased message type is resolved once here;
+        # message_type is treated as immutable after construction.
+        self._type_lower = sys.intern(self.message_type.lower())
     
     @property
     def is_text_message(self) -> bool:
         """Check if this is a text message."""
-        return self.message_type.lower() == "text"
+        return self._type_lower is _TEXT_MESSAGE_TYPE
     
     @property
     def is_media_message(self) -> bool:
         """Check if this is a media message."""
-        return self.message_type.lower() in ["image", "document", "video", "audio"]
+        return self._type_lower in _MEDIA_MESSAGE_TYPES
     
     @property
     def has_media(self) -> bool:
         """Check if message has media content."""
         return bool(self.media_url)
+    
+    def to_payload(self) -> Dict[str, Any]:
+        """Rebuild an Infobip webhook result from the parsed fields."""
+        if self.raw_payload is not None:
+            return self.raw_payload
+        
+        message: Dict[str, Any] = {"type": self.message_type.upper()}
+        if self.text is not None:
+            message["text"] = self.text
+        if self.media_url is not None:
+            message["url"] = self.media_url
+        
+        payload = {
+            "messageId": self.message_id,
+            "from": self.from_number,
+            "to": self.to_number,
+            "receivedAt": self.received_at.isoformat() if self.received_at else None,
+            "message": message
+        }
+        if self.contact_name is not None:
+            payload["contact"] = {"name": self.contact_name}
+        
+        return payload
+    
+    def to_tuple(self) -> "WebhookMessageTuple":
+        """Convert to the lightweight read-only tuple form."""
+        return WebhookMessageTuple(
+            self.message_id,
+            self.from_number,
+            self.to_number,
+            self.message_type,
+            self.text,
+            self.media_url,
+            self.contact_name,
+            self.received_at,
+            self.raw_payload
+        )
+    
+    @classmethod
+    def from_tuple(cls, message: "WebhookMessageTuple") -> "WebhookMessage":
+        """Upgrade a WebhookMessageTuple to a full WebhookMessage."""
+        return cls(*message)
+
+
+class WebhookMessageTuple(NamedTuple):
+    """
+    Read-only tuple form of WebhookMessage for high-volume webhook routing.
+    
+    Shares WebhookMessage's field names and order, so it is cheaper to build
+    and can be upgraded with WebhookMessage.from_tuple() when needed.
+    """
+    message_id: str
+    from_number: str
+    to_number: str
+    message_type: str
+    text: Optional[str] = None
+    media_url: Optional[str] = None
+    contact_name: Optional[str] = None
+    received_at: Optional[datetime] = None
+    raw_payload: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LocationData:
     """
     Structured location data for location messages.
@@ -374,16 +521,19 @@ class LocationData:
     
     def validate(self) -> bool:
         """Validate coordinate ranges."""
-        return (
-            -90 <= self.latitude <= 90 and
-            -180 <= self.longitude <= 180
-        )
+        # Two symmetric range checks combined without short-circuit branching
+        return (abs(self.latitude) <= 90) & (abs(self.longitude) <= 180)
     
     @property
     def google_maps_url(self) -> str:
         """Generate Google Maps URL for this location."""
         return f"https://www.google.com/maps?q={self.latitude},{self.longitude}"
     
+    @classmethod
+    def from_preset_index(cls, index: int) -> "LocationData":
+        """Get the preset location at the given index (see LEBANON_PRESET_KEYS)."""
+        return LEBANON_LOCATIONS[LEBANON_PRESET_KEYS[index]]
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API payload."""
         data = {
@@ -399,7 +549,20 @@ class LocationData:
         return data
 
 
-@dataclass
+def validate_locations(pairs: Iterable[Tuple[float, float]]) -> List[bool]:
+    """
+    Validate many (latitude, longitude) pairs at once.
+    
+    Same rule as LocationData.validate, without building a LocationData per
+    pair (e.g. for the coordinates of a whole webhook batch).
+    
+    Returns:
+        One bool per pair, in input order
+    """
+    return [(abs(lat) <= 90) & (abs(lon) <= 180) for lat, lon in pairs]
+
+
+@dataclass(slots=True)
 class TemplateData:
     """
     Template message data structure.
@@ -421,23 +584,9 @@ class TemplateData:
 
     def to_api_payload(self, from_number: str, to_number: str) -> Dict[str, Any]:
         """Convert to Infobip API payload format."""
-        payload = {
-            "messages": [{
-                "from": from_number,
-                "to": to_number,
-                "content": {
-                    "templateName": self.template_name,
-                    "templateData": {},
-                    "language": self.language
-                }
-            }]
-        }
-        
-        template_data = payload["messages"][0]["content"]["templateData"]
-        
         # The 'body' field with 'placeholders' is mandatory, even if empty.
-        template_data["body"] = {
-            "placeholders": self.body_variables
+        template_data: Dict[str, Any] = {
+            "body": {"placeholders": self.body_variables}
         }
         
         # Add header
@@ -455,65 +604,82 @@ class TemplateData:
         if self.buttons:
             template_data["buttons"] = self.buttons
         
-        return payload
+        # Assemble the envelope in one literal instead of walking back into it
+        return {
+            "messages": [{
+                "from": from_number,
+                "to": to_number,
+                "content": {
+                    "templateName": self.template_name,
+                    "templateData": template_data,
+                    "language": self.language
+                }
+            }]
+        }
+
+
+# Lebanon preset locations (for convenience).
+# Raw field tuples in LocationData order; objects are built on first access.
+_LEBANON_RAW: Dict[str, tuple] = {
+    "beirut": (33.888630, 35.495480, "Beirut, Lebanon", "Beirut, Lebanon", "Lebanon", "Beirut Governorate"),
+    "jounieh": (33.983333, 35.633333, "Jounieh, Lebanon", "Jounieh, Mount Lebanon Governorate, Lebanon", "Lebanon", "Mount Lebanon"),
+    "tripoli": (34.436667, 35.833333, "Tripoli, Lebanon", "Tripoli, North Governorate, Lebanon", "Lebanon", "North Governorate"),
+    "baalbek": (34.006667, 36.204167, "Baalbek, Lebanon", "Baalbek, Baalbek-Hermel Governorate, Lebanon", "Lebanon", "Baalbek-Hermel"),
+    "tyre": (33.271992, 35.203487, "Tyre, Lebanon", "Tyre, South Governorate, Lebanon", "Lebanon", "South Governorate"),
+    "sidon": (33.557144, 35.369115, "Sidon, Lebanon", "Sidon, South Governorate, Lebanon", "Lebanon", "South Governorate"),
+    "zahle": (33.846667, 35.901111, "Zahle, Lebanon", "Zahle, Beqaa Governorate, Lebanon", "Lebanon", "Beqaa Governorate"),
+}
+
+# Preset keys and coordinates as parallel columns for batch distance queries
+LEBANON_PRESET_KEYS: Tuple[str, ...] = tuple(_LEBANON_RAW)
+_PRESET_LATS = array("d", [raw[0] for raw in _LEBANON_RAW.values()])
+_PRESET_LONS = array("d", [raw[1] for raw in _LEBANON_RAW.values()])
 
 
-# Lebanon preset locations (for convenience)
-LEBANON_LOCATIONS = {
-    "beirut": LocationData(
-        latitude=33.888630,
-        longitude=35.495480,
-        name="Beirut, Lebanon",
-        address="Beirut, Lebanon",
-        country="Lebanon",
-        region="Beirut Governorate"
-    ),
-    "jounieh": LocationData(
-        latitude=33.983333,
-        longitude=35.633333,
-        name="Jounieh, Lebanon", 
-        address="Jounieh, Mount Lebanon Governorate, Lebanon",
-        country="Lebanon",
-        region="Mount Lebanon"
-    ),
-    "tripoli": LocationData(
-        latitude=34.436667,
-        longitude=35.833333,
-        name="Tripoli, Lebanon",
-        address="Tripoli, North Governorate, Lebanon",
-        country="Lebanon",
-        region="North Governorate"
-    ),
-    "baalbek": LocationData(
-        latitude=34.006667,
-        longitude=36.204167,
-        name="Baalbek, Lebanon",
-        address="Baalbek, Baalbek-Hermel Governorate, Lebanon",
-        country="Lebanon",
-        region="Baalbek-Hermel"
-    ),
-    "tyre": LocationData(
-        latitude=33.271992,
-        longitude=35.203487,
-        name="Tyre, Lebanon",
-        address="Tyre, South Governorate, Lebanon",
-        country="Lebanon",
-        region="South Governorate"
-    ),
-    "sidon": LocationData(
-        latitude=33.557144,
-        longitude=35.369115,
-        name="Sidon, Lebanon",
-        address="Sidon, South Governorate, Lebanon",
-        country="Lebanon",
-        region="South Governorate"
-    ),
-    "zahle": LocationData(
-        latitude=33.846667,
-        longitude=35.901111,
-        name="Zahle, Lebanon",
-        address="Zahle, Beqaa Governorate, Lebanon",
-        country="Lebanon",
-        region="Beqaa Governorate"
+def nearest_preset(latitude: float, longitude: float) -> str:
+    """Get the key of the preset location closest to the given coordinates."""
+    index = min(
+        range(len(LEBANON_PRESET_KEYS)),
+        key=lambda i: math.hypot(_PRESET_LATS[i] - latitude, _PRESET_LONS[i] - longitude)
     )
-} 
\ No newline at end of file
+    return LEBANON_PRESET_KEYS[index]
+
+
+class _LazyLocationMap(Mapping):
+    """Read-only preset mapping that builds each value on first lookup."""
+    
+    __slots__ = ("_build", "_cache")
+    
+    def __init__(self, build: Callable[[str], Any]):
+        self._build = build
+        self._cache: Dict[str, Any] = {}
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            # Unknown keys raise KeyError from the builder's _LEBANON_RAW lookup
+            value = self._cache[key] = self._build(key)
+            return value
+    
+    def __contains__(self, key: object) -> bool:
+        return key in _LEBANON_RAW
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_LEBANON_RAW)
+    
+    def __len__(self) -> int:
+        return len(_LEBANON_RAW)
+
+
+LEBANON_LOCATIONS: Mapping[str, LocationData] = _LazyLocationMap(
+    lambda key: LocationData(*_LEBANON_RAW[key])
+)
+
+# API content blocks and map links for the presets, memoized per key
+LEBANON_LOCATIONS_PAYLOAD: Mapping[str, Dict[str, Any]] = _LazyLocationMap(
+    lambda key: LEBANON_LOCATIONS[key].to_dict()
+)
+LEBANON_LOCATIONS_MAPS_URL: Mapping[str, str] = _LazyLocationMap(
+    lambda key: LEBANON_LOCATIONS[key].google_maps_url
+)
@@ -5,8 +5,9 @@ This module provides comprehensive validation for all input parameters
 including phone numbers, coordinates, URLs, message content, and media files.
 """
 
-import re
+import functools
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any, Tuple
 from urllib.parse import urlparse
 import logging
@@ -23,6 +24,44 @@ from .exceptions import ValidationError
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Shared session for URL accessibility checks, so repeated probes reuse
+# pooled keep-alive connections instead of a new session per request
+_HEAD_SESSION = requests.Session()
+_HEAD_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32))
+_HEAD_SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+# MIME types and media types come from small fixed sets, so memoize the
+# lookups (including their .lower() call) per distinct input
+_is_supported_format = functools.lru_cache(maxsize=64)(MediaTypes.is_supported_format)
+_get_size_limit = functools.lru_cache(maxsize=8)(FileLimits.get_size_limit)
+
+# Per-call constants and bound methods hoisted out of the constants classes,
+# so the hot validators do a single global lookup instead of class attributes
+_MAX_TEXT_LENGTH = MessageLimits.MAX_TEXT_LENGTH
+_MAX_CAPTION_LENGTH = MessageLimits.MAX_CAPTION_LENGTH
+_MAX_LOCATION_NAME_LENGTH = MessageLimits.MAX_LOCATION_NAME_LENGTH
+_MAX_LOCATION_ADDRESS_LENGTH = MessageLimits.MAX_LOCATION_ADDRESS_LENGTH
+_MAX_TEMPLATE_VARIABLES = MessageLimits.MAX_TEMPLATE_VARIABLES
+_is_e164 = ValidationPatterns.is_e164
+_match_simple_phone = ValidationPatterns.PHONE_NUMBER_SIMPLE_RE.match
+
+# Error strings whose operands are all constants, formatted once
+_SUPPORTED_FORMATS_STR = ", ".join(sorted(MediaTypes.ALL_FORMATS))
+_MESSAGE_TOO_LONG_MSG = ErrorMessages.MESSAGE_TOO_LONG.format(max_length=MessageLimits.MAX_TEXT_LENGTH)
+_CAPTION_TOO_LONG_MSG = ErrorMessages.CAPTION_TOO_LONG.format(max_length=MessageLimits.MAX_CAPTION_LENGTH)
+_LOCATION_NAME_TOO_LONG_MSG = (
+    f"Location name exceeds maximum length of {MessageLimits.MAX_LOCATION_NAME_LENGTH} characters"
+)
+_LOCATION_ADDRESS_TOO_LONG_MSG = (
+    f"Location address exceeds maximum length of {MessageLimits.MAX_LOCATION_ADDRESS_LENGTH} characters"
+)
+
+
+def _is_ascii_word(value: str) -> bool:
+    """Check value is non-empty and only ASCII letters, digits, '_' and '-'."""
+    # Equivalent to ^[a-zA-Z0-9_-]+$ using C-level str methods instead of re
+    return value.isascii() and value.replace("_", "a").replace("-", "a").isalnum()
+
 
 def validate_phone_number(phone_number: str, strict: bool = False) -> bool:
     """
@@ -50,15 +89,22 @@ def validate_phone_number(phone_number: str, strict: bool = False) -> bool:
     # Clean the phone number
     cleaned = phone_number.strip()
     
-    # Choose pattern based on strictness
-    pattern = ValidationPatterns.PHONE_NUMBER_PATTERN if strict else ValidationPatterns.PHONE_NUMBER_SIMPLE_PATTERN
-    
     # Additional check for double plus signs
     if "++" in cleaned:
         is_valid = False
+    elif strict:
+        # E.164 format ("+" and at most 15 digits); length rejects skip the regex
+        is_valid = 2 <= len(cleaned) <= 16 and _is_e164(cleaned)
+    elif not 8 <= len(cleaned) <= 20:
+        # Outside the simple pattern's length bounds
+        is_valid = False
     else:
-        # Validate format
-        is_valid = bool(re.match(pattern, cleaned))
+        # Plain (optionally "+"-prefixed) ASCII digits always match the simple
+        # pattern; only formatted numbers need the regex
+        digits = cleaned[1:] if cleaned[0] == "+" else cleaned
+        is_valid = (digits.isascii() and digits.isdigit()) or bool(
+            _match_simple_phone(cleaned)
+        )
     
     if not is_valid and strict:
         raise ValidationError(
@@ -85,17 +131,22 @@ def validate_coordinates(latitude: float, longitude: float, strict: bool = False
     Raises:
         ValidationError: If coordinates are invalid and strict validation
     """
-    try:
-        lat = float(latitude)
-        lon = float(longitude)
-    except (TypeError, ValueError):
-        if strict:
-            raise ValidationError(
-                "Coordinates must be numeric values",
-                field="coordinates",
-                value=f"lat={latitude}, lon={longitude}"
-            )
-        return False
+    if type(latitude) is float and type(longitude) is float:
+        # Already floats (the usual case); no conversion needed
+        lat = latitude
+        lon = longitude
+    else:
+        try:
+            lat = float(latitude)
+            lon = float(longitude)
+        except (TypeError, ValueError):
+            if strict:
+                raise ValidationError(
+                    "Coordinates must be numeric values",
+                    field="coordinates",
+                    value=f"lat={latitude}, lon={longitude}"
+                )
+            return False
     
     # Check ranges
     lat_valid = -90 <= lat <= 90
@@ -119,6 +170,32 @@ def validate_coordinates(latitude: float, longitude: float, strict: bool = False
     return is_valid
 
 
+def _plain_http_scheme(url: str) -> Optional[str]:
+    """
+    Get the lowercased scheme of a plain "http(s)://host..." URL.
+    
+    Returns None for anything urlparse could treat differently (other or
+    missing schemes, empty host, non-ASCII, brackets, embedded tabs or
+    newlines), leaving those to the full parser.
+    """
+    i = url.find("://")
+    # The separator position already tells which scheme it can be
+    if i == 5:
+        scheme = "https"
+    elif i == 4:
+        scheme = "http"
+    else:
+        return None
+    if url[:i].lower() != scheme:
+        return None
+    rest = url[i + 3:]
+    if not rest or rest[0] in "/?#" or not rest.isascii():
+        return None
+    if "[" in rest or "]" in rest or "\t" in rest or "\n" in rest or "\r" in rest:
+        return None
+    return scheme
+
+
 def validate_url(url: str, require_https: bool = True, check_accessibility: bool = False, strict: bool = False) -> bool:
     """
     Validate URL format and optionally check accessibility.
@@ -144,40 +221,46 @@ def validate_url(url: str, require_https: bool = True, check_accessibility: bool
             )
         return False
     
-    # Parse URL
-    try:
-        parsed = urlparse(url.strip())
-    except Exception:
-        if strict:
-            raise ValidationError(
-                "Invalid URL format",
-                field="url",
-                value=url
-            )
-        return False
+    cleaned = url.strip()
+    scheme = _plain_http_scheme(cleaned)
     
-    # Check basic format
-    if not parsed.scheme or not parsed.netloc:
-        if strict:
-            raise ValidationError(
-                "URL must include protocol and domain",
-                field="url",
-                value=url
-            )
-        return False
-    
-    # Check for supported protocols (HTTP/HTTPS only)
-    if parsed.scheme.lower() not in ['http', 'https']:
-        if strict:
-            raise ValidationError(
-                "URL must use HTTP or HTTPS protocol",
-                field="url",
-                value=url
-            )
-        return False
+    if scheme is None:
+        # Not a plain http(s)://host URL; use the full parser so the
+        # failure (or unusual success) is reported exactly
+        try:
+            parsed = urlparse(cleaned)
+        except Exception:
+            if strict:
+                raise ValidationError(
+                    "Invalid URL format",
+                    field="url",
+                    value=url
+                )
+            return False
+        
+        # Check basic format
+        if not parsed.scheme or not parsed.netloc:
+            if strict:
+                raise ValidationError(
+                    "URL must include protocol and domain",
+                    field="url",
+                    value=url
+                )
+            return False
+        
+        # Check for supported protocols (HTTP/HTTPS only)
+        scheme = parsed.scheme.lower()
+        if scheme not in ('http', 'https'):
+            if strict:
+                raise ValidationError(
+                    "URL must use HTTP or HTTPS protocol",
+                    field="url",
+                    value=url
+                )
+            return False
     
     # Check HTTPS requirement
-    if require_https and parsed.scheme.lower() != 'https':
+    if require_https and scheme != 'https':
         if strict:
             raise ValidationError(
                 "URL must use HTTPS protocol",
@@ -189,7 +272,7 @@ def validate_url(url: str, require_https: bool = True, check_accessibility: bool
     # Check accessibility if requested
     if check_accessibility:
         try:
-            response = requests.head(url, timeout=10, allow_redirects=True)
+            response = _HEAD_SESSION.head(url, timeout=10, allow_redirects=True)
             if response.status_code >= 400:
                 if strict:
                     raise ValidationError(
@@ -210,6 +293,64 @@ def validate_url(url: str, require_https: bool = True, check_accessibility: bool
     return True
 
 
+def _validate_https_url_nonstrict(url: str) -> bool:
+    """
+    validate_url specialized for require_https=True, check_accessibility=False
+    and strict=False, the shape used by validate_all_message_params.
+    """
+    if not url or not isinstance(url, str):
+        return False
+    scheme = _plain_http_scheme(url.strip())
+    if scheme is None:
+        # Unusual URL: let the general validator decide
+        return validate_url(url, require_https=True)
+    return scheme == "https"
+
+
+def validate_urls_batch(urls: List[str], require_https: bool = True, max_workers: int = 16) -> List[bool]:
+    """
+    Validate many URLs including accessibility, probing them concurrently.
+    
+    Args:
+        urls: URLs to validate
+        require_https: Require HTTPS protocol
+        max_workers: Maximum number of concurrent HEAD requests
+        
+    Returns:
+        List of validation results in the same order as urls
+    """
+    if not urls:
+        return []
+    
+    def check(url: str) -> bool:
+        return validate_url(url, require_https=require_https, check_accessibility=True)
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(executor.map(check, urls))
+
+
+def _validate_bounded_string(
+    value: Any,
+    max_length: int,
+    field: str,
+    type_message: str,
+    length_message: str,
+    strict: bool
+) -> bool:
+    """Shared string type and length checks for the text validators."""
+    if not isinstance(value, str):
+        if strict:
+            raise ValidationError(type_message, field=field, value=value)
+        return False
+    
+    if len(value) > max_length:
+        if strict:
+            raise ValidationError(length_message, field=field, value=value)
+        return False
+    
+    return True
+
+
 def validate_message_text(text: str, max_length: Optional[int] = None, strict: bool = False) -> bool:
     """
     Validate message text content.
@@ -234,28 +375,19 @@ def validate_message_text(text: str, max_length: Optional[int] = None, strict: b
             )
         return False
     
-    if not isinstance(text, str):
-        if strict:
-            raise ValidationError(
-                "Message text must be a string",
-                field="text",
-                value=text
-            )
-        return False
-    
-    # Check length
-    max_len = max_length or MessageLimits.MAX_TEXT_LENGTH
-    if len(text) > max_len:
-        if strict:
-            raise ValidationError(
-                ErrorMessages.MESSAGE_TOO_LONG.format(max_length=max_len),
-                field="text",
-                value=text
-            )
+    # Check type and length
+    max_len = max_length or _MAX_TEXT_LENGTH
+    if max_len == _MAX_TEXT_LENGTH:
+        length_message = _MESSAGE_TOO_LONG_MSG
+    else:
+        length_message = ErrorMessages.MESSAGE_TOO_LONG.format(max_length=max_len)
+    if not _validate_bounded_string(
+        text, max_len, "text", "Message text must be a string", length_message, strict
+    ):
         return False
     
-    # Check for empty text
-    if not text.strip():
+    # Check for empty text (isspace scans in place instead of copying via strip)
+    if not text or text.isspace():
         if strict:
             raise ValidationError(
                 "Message text cannot be empty",
@@ -284,26 +416,14 @@ def validate_caption(caption: str, strict: bool = False) -> bool:
     if caption is None or caption == "":
         return True  # Empty caption is allowed
     
-    if not isinstance(caption, str):
-        if strict:
-            raise ValidationError(
-                "Caption must be a string",
-                field="caption",
-                value=caption
-            )
-        return False
-    
-    # Check length
-    if len(caption) > MessageLimits.MAX_CAPTION_LENGTH:
-        if strict:
-            raise ValidationError(
-                ErrorMessages.CAPTION_TOO_LONG.format(max_length=MessageLimits.MAX_CAPTION_LENGTH),
-                field="caption",
-                value=caption
-            )
-        return False
-    
-    return True
+    return _validate_bounded_string(
+        caption,
+        _MAX_CAPTION_LENGTH,
+        "caption",
+        "Caption must be a string",
+        _CAPTION_TOO_LONG_MSG,
+        strict
+    )
 
 
 def validate_location_name(name: str, strict: bool = False) -> bool:
@@ -323,25 +443,14 @@ def validate_location_name(name: str, strict: bool = False) -> bool:
     if name is None or name == "":
         return True  # Empty name is allowed
     
-    if not isinstance(name, str):
-        if strict:
-            raise ValidationError(
-                "Location name must be a string",
-                field="location_name",
-                value=name
-            )
-        return False
-    
-    if len(name) > MessageLimits.MAX_LOCATION_NAME_LENGTH:
-        if strict:
-            raise ValidationError(
-                f"Location name exceeds maximum length of {MessageLimits.MAX_LOCATION_NAME_LENGTH} characters",
-                field="location_name",
-                value=name
-            )
-        return False
-    
-    return True
+    return _validate_bounded_string(
+        name,
+        _MAX_LOCATION_NAME_LENGTH,
+        "location_name",
+        "Location name must be a string",
+        _LOCATION_NAME_TOO_LONG_MSG,
+        strict
+    )
 
 
 def validate_location_address(address: str, strict: bool = False) -> bool:
@@ -361,25 +470,14 @@ def validate_location_address(address: str, strict: bool = False) -> bool:
     if address is None or address == "":
         return True  # Empty address is allowed
     
-    if not isinstance(address, str):
-        if strict:
-            raise ValidationError(
-                "Location address must be a string",
-                field="location_address",
-                value=address
-            )
-        return False
-    
-    if len(address) > MessageLimits.MAX_LOCATION_ADDRESS_LENGTH:
-        if strict:
-            raise ValidationError(
-                f"Location address exceeds maximum length of {MessageLimits.MAX_LOCATION_ADDRESS_LENGTH} characters",
-                field="location_address",
-                value=address
-            )
-        return False
-    
-    return True
+    return _validate_bounded_string(
+        address,
+        _MAX_LOCATION_ADDRESS_LENGTH,
+        "location_address",
+        "Location address must be a string",
+        _LOCATION_ADDRESS_TOO_LONG_MSG,
+        strict
+    )
 
 
 def validate_template_name(template_name: str, strict: bool = False) -> bool:
@@ -406,7 +504,7 @@ def validate_template_name(template_name: str, strict: bool = False) -> bool:
         return False
     
     # Basic format check (alphanumeric, underscore, hyphen)
-    if not re.match(r'^[a-zA-Z0-9_-]+$', template_name.strip()):
+    if not _is_ascii_word(template_name.strip()):
         if strict:
             raise ValidationError(
                 "Template name can only contain letters, numbers, underscores, and hyphens",
@@ -446,7 +544,7 @@ def validate_template_variables(variables: List[str], max_count: Optional[int] =
         return False
     
     # Check count
-    max_vars = max_count or MessageLimits.MAX_TEMPLATE_VARIABLES
+    max_vars = max_count or _MAX_TEMPLATE_VARIABLES
     if len(variables) > max_vars:
         if strict:
             raise ValidationError(
@@ -456,18 +554,19 @@ def validate_template_variables(variables: List[str], max_count: Optional[int] =
             )
         return False
     
-    # Check each variable
-    for i, var in enumerate(variables):
-        if not isinstance(var, str):
-            if strict:
+    # Check each variable; the index is only needed for the strict error
+    if all(isinstance(var, str) for var in variables):
+        return True
+    
+    if strict:
+        for i, var in enumerate(variables):
+            if not isinstance(var, str):
                 raise ValidationError(
                     f"Template variable at index {i} must be a string",
                     field="template_variables",
                     value=variables
                 )
-            return False
-    
-    return True
+    return False
 
 
 def validate_file_size(file_size: int, media_type: str = "image", strict: bool = False) -> bool:
@@ -495,7 +594,7 @@ def validate_file_size(file_size: int, media_type: str = "image", strict: bool =
         return False
     
     # Get size limit for media type
-    size_limit = FileLimits.get_size_limit(media_type)
+    size_limit = _get_size_limit(media_type)
     
     if file_size > size_limit:
         if strict:
@@ -533,14 +632,13 @@ def validate_content_type(content_type: str, strict: bool = False) -> bool:
         return False
     
     # Check if supported
-    is_supported = MediaTypes.is_supported_format(content_type)
+    is_supported = _is_supported_format(content_type)
     
     if not is_supported and strict:
-        supported_formats = ", ".join(sorted(MediaTypes.ALL_FORMATS))
         raise ValidationError(
             ErrorMessages.UNSUPPORTED_FORMAT.format(
                 format=content_type,
-                supported=supported_formats
+                supported=_SUPPORTED_FORMATS_STR
             ),
             field="content_type",
             value=content_type
@@ -574,7 +672,7 @@ def validate_message_id(message_id: str, strict: bool = False) -> bool:
     
     # Basic format check (UUID-like or alphanumeric with hyphens)
     cleaned = message_id.strip()
-    if not re.match(r'^[a-zA-Z0-9\-_]+$', cleaned):
+    if not _is_ascii_word(cleaned):
         if strict:
             raise ValidationError(
                 "Invalid message ID format",
@@ -611,7 +709,7 @@ def validate_language_code(language: str, strict: bool = False) -> bool:
     
     # Basic format check (2-letter code)
     cleaned = language.strip().lower()
-    if not re.match(r'^[a-z]{2}$', cleaned):
+    if not (len(cleaned) == 2 and cleaned.isascii() and cleaned.isalpha()):
         if strict:
             raise ValidationError(
                 "Language code must be 2-letter ISO 639-1 format (e.g., 'en', 'ar')",
@@ -646,46 +744,32 @@ def validate_all_message_params(
     Raises:
         ValidationError: If any parameter is invalid and strict validation
     """
+    # Sub-validators only raise in strict mode, where the error propagates
+    # unchanged, so no per-call try/except is needed
     errors = []
     
     # Validate phone number
-    try:
-        if not validate_phone_number(to_number, strict=strict):
-            errors.append("Invalid phone number format")
-    except ValidationError as e:
-        if strict:
-            raise
-        errors.append(str(e))
+    if not validate_phone_number(to_number, strict=strict):
+        errors.append("Invalid phone number format")
     
     # Validate message content if provided
     if message_content is not None:
-        try:
-            if not validate_message_text(message_content, strict=strict):
-                errors.append("Invalid message text")
-        except ValidationError as e:
-            if strict:
-                raise
-            errors.append(str(e))
+        if not validate_message_text(message_content, strict=strict):
+            errors.append("Invalid message text")
     
     # Validate media URL if provided
     if media_url is not None:
-        try:
-            if not validate_url(media_url, require_https=True, strict=strict):
-                errors.append("Invalid media URL")
-        except ValidationError as e:
-            if strict:
-                raise
-            errors.append(str(e))
+        if strict:
+            media_url_valid = validate_url(media_url, require_https=True, strict=True)
+        else:
+            media_url_valid = _validate_https_url_nonstrict(media_url)
+        if not media_url_valid:
+            errors.append("Invalid media URL")
     
     # Validate caption if provided
     if caption is not None:
-        try:
-            if not validate_caption(caption, strict=strict):
-                errors.append("Invalid caption")
-        except ValidationError as e:
-            if strict:
-                raise
-            errors.append(str(e))
+        if not validate_caption(caption, strict=strict):
+            errors.append("Invalid caption")
     
     return len(errors) == 0, errors
 
@@ -713,35 +797,21 @@ def validate_location_params(
     Raises:
         ValidationError: If any parameter is invalid and strict validation
     """
+    # See validate_all_message_params: sub-validators only raise when strict
     errors = []
     
     # Validate coordinates
-    try:
-        if not validate_coordinates(latitude, longitude, strict=strict):
-            errors.append("Invalid coordinates")
-    except ValidationError as e:
-        if strict:
-            raise
-        errors.append(str(e))
+    if not validate_coordinates(latitude, longitude, strict=strict):
+        errors.append("Invalid coordinates")
     
     # Validate name if provided
     if name is not None:
-        try:
-            if not validate_location_name(name, strict=strict):
-                errors.append("Invalid location name")
-        except ValidationError as e:
-            if strict:
-                raise
-            errors.append(str(e))
+        if not validate_location_name(name, strict=strict):
+            errors.append("Invalid location name")
     
     # Validate address if provided
     if address is not None:
-        try:
-            if not validate_location_address(address, strict=strict):
-                errors.append("Invalid location address")
-        except ValidationError as e:
-            if strict:
-                raise
-            errors.append(str(e))
+        if not validate_location_address(address, strict=strict):
+            errors.append("Invalid location address")
     
     return len(errors) == 0, errors 
\ No newline at end of file
@@ -15,6 +15,8 @@ Usage:
 import os
 import sys
 import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import requests
@@ -28,14 +30,24 @@ except Exception as e:
     sys.exit(2)
 
 
+@functools.lru_cache(maxsize=None)
 def env_or(*keys: str, default: Optional[str] = None) -> Optional[str]:
+    # Cached per key tuple; only call after load_dotenv() has populated the environment
+    environ = os.environ
     for k in keys:
-        v = os.getenv(k)
+        v = environ.get(k)
         if v:
             return v
     return default
 
 
+def dump_json(data: dict) -> str:
+    # Pretty-print for a terminal; compact (C encoder) output when piped
+    if sys.stdout.isatty():
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(",", ":"))
+
+
 def probe_rest_endpoint(session: requests.Session, base_url: str, endpoint: str) -> int:
     url = f"{base_url}{endpoint}"
     try:
@@ -61,30 +73,38 @@ def main() -> int:
     # 1) GraphQL: list declared scopes
     perms = client.get_permissions()
     if not perms.get("success"):
-        print(json.dumps({"success": False, "error": perms.get("error")}))
+        print(dump_json({"success": False, "error": perms.get("error")}))
         return 2
 
     scope_list = perms["data"].get("scopes", [])
+    scope_set = frozenset(scope_list)
     scope_list_sorted = sorted(scope_list)
 
-    # 2) REST probes for a few sensitive endpoints
+    # 2) REST probes for a few sensitive endpoints, run concurrently over the
+    #    client's pooled session (sized by HTTP_POOL_MAXSIZE in shopify_method)
     rest_base = f"https://{client.shop_domain}/admin/api/{client.api_version}"
-    probes = {
-        "price_rules": probe_rest_endpoint(client.session, rest_base, "/price_rules.json?limit=1"),
-        "discount_codes": probe_rest_endpoint(client.session, rest_base, "/discount_codes/lookup.json?code=TEST"),
+    probe_endpoints = {
+        "price_rules": "/price_rules.json?limit=1",
+        "discount_codes": "/discount_codes/lookup.json?code=TEST",
     }
+    with ThreadPoolExecutor(max_workers=len(probe_endpoints)) as ex:
+        futures = {
+            name: ex.submit(probe_rest_endpoint, client.session, rest_base, endpoint)
+            for name, endpoint in probe_endpoints.items()
+        }
+        probes = {name: future.result() for name, future in futures.items()}
 
     result = {
         "success": True,
         "shop": client.shop_domain,
         "api_version": client.api_version,
         "scopes": scope_list_sorted,
-        "has_read_price_rules": "read_price_rules" in scope_list_sorted,
-        "has_read_discounts": "read_discounts" in scope_list_sorted,
+        "has_read_price_rules": "read_price_rules" in scope_set,
+        "has_read_discounts": "read_discounts" in scope_set,
         "rest_probe": probes,
     }
 
-    print(json.dumps(result, indent=2))
+    print(dump_json(result))
     return 0
 
 
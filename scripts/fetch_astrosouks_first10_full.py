@@ -11,40 +11,44 @@ Usage:
   python scripts/fetch_astrosouks_first10_full.py
 """
 
+import html
 import os
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TextIO
 
 from dotenv import load_dotenv
-from shopify_method import ShopifyClient
-from shopify_method.utils import extract_id_from_gid
+from shopify_method import ShopifyClient, ShopifyAPIError
+from shopify_method.utils import sanitize_filename_component
 
 
-def _sanitize_filename_component(text: str) -> str:
-    sanitized = (text or "").strip().lower()
-    for ch in [" ", ".", "/", "\\", ":", "*", "?", "\"", "<", ">", "|"]:
-        sanitized = sanitized.replace(ch, "_")
-    sanitized = sanitized.replace("-", "_")
-    return sanitized[:80] or "store"
-
-
-def _fmt_discount(price: Optional[Any], compare_at: Optional[Any]) -> str:
+def _format_price_block(price: Optional[Any], compare_at: Optional[Any]) -> str:
+    """Human-friendly variant price: "was $X, now $Y (Z% off)" when discounted."""
+    # No price means nothing to show or compare against; decided before parsing
+    if price is None:
+        return "price=N/A"
     try:
-        if price is None or compare_at is None:
-            return ""
         p = float(price)
+        if compare_at is None:
+            return f"price=${p:.2f}"
         c = float(compare_at)
-        if c > p and p > 0:
-            pct = round((c - p) / c * 100.0, 2)
-            return f" | discount={pct}%"
-        return ""
     except Exception:
-        return ""
+        # Fallback plain values
+        return f"price={price} | compareAt={compare_at}"
+    if c > p and p > 0:
+        pct = round((c - p) / c * 100.0, 2)
+        return f"price: was ${c:.2f}, now ${p:.2f} ({pct}% off)"
+    return f"price=${p:.2f} | compareAt=${c:.2f}"
+
+
+_TAG_RE = re.compile(r"<[^>]+>")
 
 
 def _strip_html(text: str) -> str:
     try:
-        return re.sub(r"<[^>]+>", "", text)
+        if "<" in text:
+            text = _TAG_RE.sub("", text)
+        # Decode entities the tag strip leaves behind (e.g. "A&amp;B" -> "A&B")
+        return html.unescape(text) if "&" in text else text
     except Exception:
         return text
 
@@ -57,111 +61,83 @@ def _extract_description_from_product_dict(pd: Dict[str, Any]) -> str:
     return ""
 
 
-def _format_product_block(p: Dict[str, Any], client: Optional[ShopifyClient] = None) -> str:
-    lines: List[str] = []
+def _fetch_missing_descriptions(client: ShopifyClient, products: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Batch-fetch descriptions for products returned without one, keyed by product gid."""
+    missing = [p["id"] for p in products if p.get("id") and not _extract_description_from_product_dict(p)]
+    if not missing:
+        return {}
+    try:
+        nodes = client.get_nodes(missing, "... on Product { descriptionHtml }")
+    except ShopifyAPIError as e:
+        print(f"WARNING: description lookup failed: {e}")
+        return {}
+    desc_map: Dict[str, str] = {}
+    for gid, node in nodes.items():
+        desc = _extract_description_from_product_dict(node)
+        if desc:
+            desc_map[gid] = desc
+    return desc_map
+
+
+def _format_product_block(p: Dict[str, Any], out: TextIO, desc_map: Optional[Dict[str, str]] = None) -> None:
+    # Lines go straight to ``out`` (the output file or a StringIO) rather than
+    # through an intermediate list + join
+    write = out.write
     title = p.get("title") or p.get("handle") or "Unknown"
-    lines.append(f"# {title}")
-    lines.append(
-        "ID: {id}  |  Handle: {handle}  |  Status: {status}  |  Vendor: {vendor}  |  Type: {ptype}".format(
-            id=p.get("id"),
-            handle=p.get("handle"),
-            status=p.get("status"),
-            vendor=p.get("vendor"),
-            ptype=p.get("productType"),
-        )
+    write(f"# {title}\n")
+    write(
+        f"ID: {p.get('id')}  |  Handle: {p.get('handle')}  |  Status: {p.get('status')}  |  "
+        f"Vendor: {p.get('vendor')}  |  Type: {p.get('productType')}\n"
     )
     tags = p.get("tags") or []
     if isinstance(tags, list):
-        lines.append(f"Tags: {', '.join(tags)}")
+        write(f"Tags: {', '.join(tags)}\n")
     created = p.get("createdAt")
     updated = p.get("updatedAt")
-    lines.append(f"Created: {created}  |  Updated: {updated}")
+    write(f"Created: {created}  |  Updated: {updated}\n")
 
-    # Description (prefer inline; fallback to per-product API if missing)
+    # Description (prefer inline; fallback to the batch-fetched map if missing)
     desc = _extract_description_from_product_dict(p)
-    if not desc and client is not None:
-        gid = p.get("id")
-        try:
-            numeric_id = extract_id_from_gid(gid) if gid else None
-        except Exception:
-            numeric_id = None
-        if numeric_id:
-            details = client.get_product(product_id=str(numeric_id))
-            if details.get("success"):
-                prod = details.get("data") or {}
-                desc = _extract_description_from_product_dict(prod)
+    if not desc and desc_map:
+        desc = desc_map.get(p.get("id"), "")
     if desc:
-        lines.append("Description:")
+        write("Description:\n")
         for ln in desc.splitlines():
-            lines.append(f"  {ln}")
+            write(f"  {ln}\n")
 
     # Images (limit to top 5 to keep concise)
     images_list = p.get("images") or []
-    lines.append(f"Images (up to 5): {min(len(images_list), 5)} of {len(images_list)} total")
+    write(f"Images (up to 5): {min(len(images_list), 5)} of {len(images_list)} total\n")
     for node in images_list[:5]:
         url = node.get("src") or node.get("url")
         alt = node.get("altText")
         if url:
             if alt:
-                lines.append(f"  - {url}  (alt: {alt})")
+                write(f"  - {url}  (alt: {alt})\n")
             else:
-                lines.append(f"  - {url}")
+                write(f"  - {url}\n")
 
     # Variants
     var_list = p.get("variants") or []
-    lines.append(f"Variants: {len(var_list)}")
+    write(f"Variants: {len(var_list)}\n")
     for node in var_list:
-        price = node.get("price")
-        compare = node.get("compareAtPrice")
-        # Build a human-friendly price block: "was $X, now $Y (Z% off)" when discounted
-        price_block = None
-        try:
-            if price is not None and compare is not None:
-                p = float(price)
-                c = float(compare)
-                if c > p and p > 0:
-                    pct = round((c - p) / c * 100.0, 2)
-                    price_block = f"price: was ${c:.2f}, now ${p:.2f} ({pct}% off)"
-                else:
-                    price_block = f"price=${p:.2f} | compareAt=${c:.2f}"
-            elif price is not None:
-                p = float(price)
-                price_block = f"price=${p:.2f}"
-        except Exception:
-            # Fallback plain values
-            price_block = f"price={price} | compareAt={compare}" if (price is not None or compare is not None) else "price=N/A"
+        price_block = _format_price_block(node.get("price"), node.get("compareAtPrice"))
         sku = node.get("sku")
         barcode = node.get("barcode")
         inv = node.get("inventoryQuantity")
         avail = node.get("availableForSale")
         vtitle = node.get("title")
         vid = node.get("id")
-        lines.append(
-            "  - {vtitle} | {price_block} | id={vid} | sku={sku} | barcode={barcode} | inv={inv} | available={avail}".format(
-                vtitle=vtitle,
-                price_block=price_block or "price=N/A",
-                vid=vid,
-                sku=sku,
-                barcode=barcode,
-                inv=inv,
-                avail=avail,
-            )
+        write(
+            f"  - {vtitle} | {price_block} | id={vid} | sku={sku} | "
+            f"barcode={barcode} | inv={inv} | available={avail}\n"
         )
         # Variant selected options (if present)
         sel = node.get("selectedOptions")
         if isinstance(sel, list) and sel:
-            try:
-                opts = ", ".join([
-                    f"{(o or {}).get('name')}: {(o or {}).get('value')}" for o in sel
-                    if isinstance(o, dict)
-                ])
-                if opts.strip():
-                    lines.append(f"    options: {opts}")
-            except Exception:
-                pass
-
-    lines.append("")
-    return "\n".join(lines)
+            opts = ", ".join([f"{o.get('name')}: {o.get('value')}" for o in sel if isinstance(o, dict)])
+            if opts.strip():
+                write(f"    options: {opts}\n")
 
 
 def main() -> None:
@@ -183,21 +159,18 @@ def main() -> None:
 
     data = result.get("data") or {}
     products = data.get("products") or []
+    desc_map = _fetch_missing_descriptions(client, products)
 
-    domain_component = _sanitize_filename_component(shop_domain)
+    domain_component = sanitize_filename_component(shop_domain)
     out_path = os.path.join(os.path.dirname(__file__), f"../astrosouks_first10_products_{domain_component}.txt")
     out_path = os.path.abspath(out_path)
 
-    lines: List[str] = []
-    lines.append(f"Shop Domain: {shop_domain}")
-    lines.append(f"Product Count (requested 10): {len(products)}")
-    lines.append("")
-
-    for p in products:
-        lines.append(_format_product_block(p))
-
     with open(out_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        f.write(f"Shop Domain: {shop_domain}\n")
+        f.write(f"Product Count (requested 10): {len(products)}\n\n")
+        for p in products:
+            _format_product_block(p, f, desc_map)
+            f.write("\n")
 
     print(f"Saved first 10 products (full details) to {out_path}")
 
@@ -17,33 +17,28 @@ Output:
 
 import os
 import sys
-from typing import Dict, Any, List, Optional
+import itertools
+from typing import Dict, Any, Iterator, TextIO
 
 from dotenv import load_dotenv
-from shopify_method import ShopifyClient
-
-
-def _sanitize_filename_component(text: str) -> str:
-    sanitized = (text or "").strip().lower()
-    for ch in [" ", ".", "/", "\\", ":", "*", "?", "\"", "<", ">", "|"]:
-        sanitized = sanitized.replace(ch, "_")
-    sanitized = sanitized.replace("-", "_")
-    return sanitized[:80] or "store"
+from shopify_method import ShopifyClient, ShopifyAPIError
+from shopify_method.utils import group_bulk_records, sanitize_filename_component
 
 
+# Only the image url/alt are written out, so select just those through media
+# nodes (no per-image id, cursor or edge wrapper)
 PAGINATED_ACTIVE_PRODUCTS_QUERY = """
 query getActiveProducts($first: Int!, $after: String, $query: String) {
   products(first: $first, after: $after, query: $query) {
     edges {
-      cursor
       node {
         id
         title
         handle
         status
         vendor
-        images(first: 50) {
-          edges { node { id src altText } }
+        media(first: 10, query: "media_type:IMAGE") {
+          nodes { preview { image { url altText } } }
         }
       }
     }
@@ -55,26 +50,67 @@ query getActiveProducts($first: Int!, $after: String, $query: String) {
 }
 """
 
+# Same fields as above for a bulk export: no paging arguments, and every
+# media node comes back as its own JSONL record linked by __parentId
+BULK_ACTIVE_PRODUCTS_QUERY = """
+{
+  products(query: "status:active") {
+    edges {
+      node {
+        id
+        title
+        handle
+        status
+        vendor
+        media(query: "media_type:IMAGE") {
+          edges { node { preview { image { url altText } } } }
+        }
+      }
+    }
+  }
+}
+"""
 
-def _format_product_images(product: Dict[str, Any]) -> str:
-    lines: List[str] = []
-    lines.append(f"# {product.get('title')}")
-    lines.append(f"ID: {product.get('id')}  |  Handle: {product.get('handle')}  |  Status: {product.get('status')}  |  Vendor: {product.get('vendor')}")
+# Products per page: 80 * (1 + 10 media nodes) stays below the 1000-point single query cost limit
+PAGE_SIZE = 80
 
-    images_conn = product.get('images') or {}
-    image_edges = images_conn.get('edges') or []
-    lines.append(f"Images: {len(image_edges)}")
-    for edge in image_edges:
-        node = (edge or {}).get('node') or {}
-        url = node.get('src')
-        alt = node.get('altText')
+
+def _is_active(product: Dict[str, Any]) -> bool:
+    # Only ACTIVE products will be returned by the search query, but keep a defensive check
+    return (product.get("status") or "").upper() == "ACTIVE"
+
+
+def _iter_active_products_bulk(client: ShopifyClient) -> Iterator[Dict[str, Any]]:
+    """Stream all ACTIVE products from one bulk operation, re-nesting image media."""
+    for product, children in group_bulk_records(client.run_bulk_query(BULK_ACTIVE_PRODUCTS_QUERY)):
+        if _is_active(product):
+            product["media"] = {"nodes": children}
+            yield product
+
+
+def _iter_active_products_paginated(client: ShopifyClient) -> Iterator[Dict[str, Any]]:
+    """Stream all ACTIVE products by paging id ranges concurrently (fallback when bulk operations are unavailable)."""
+    products = client.iter_products_parallel(
+        PAGINATED_ACTIVE_PRODUCTS_QUERY, search="status:active", page_size=PAGE_SIZE
+    )
+    return (product for product in products if _is_active(product))
+
+
+def _format_product_images(product: Dict[str, Any], out: TextIO) -> None:
+    write = out.write
+    write(f"# {product.get('title')}\n")
+    write(f"ID: {product.get('id')}  |  Handle: {product.get('handle')}  |  Status: {product.get('status')}  |  Vendor: {product.get('vendor')}\n")
+
+    media_nodes = (product.get('media') or {}).get('nodes') or []
+    write(f"Images: {len(media_nodes)}\n")
+    for media in media_nodes:
+        image = ((media or {}).get('preview') or {}).get('image') or {}
+        url = image.get('url')
+        alt = image.get('altText')
         if alt:
-            lines.append(f"  - {url}  (alt: {alt})")
+            write(f"  - {url}  (alt: {alt})\n")
         else:
-            lines.append(f"  - {url}")
-
-    lines.append("")
-    return "\n".join(lines)
+            write(f"  - {url}\n")
 
 
 def main() -> None:
@@ -89,44 +125,37 @@ def main() -> None:
 
     client = ShopifyClient(shop_domain=shop_domain, access_token=access_token)
 
-    all_active_products: List[Dict[str, Any]] = []
-    first = 50
-    after: Optional[str] = None
-    search_query = "status:active"
-
-    while True:
-        variables = {"first": first, "after": after, "query": search_query}
-        data = client._make_graphql_request(PAGINATED_ACTIVE_PRODUCTS_QUERY, variables)
-        products_conn = (data.get("data") or {}).get("products") or {}
-        edges = products_conn.get("edges") or []
-        for edge in edges:
-            node = (edge or {}).get("node")
-            if node:
-                # Only ACTIVE products will be returned by the search query, but keep a defensive check
-                if (node.get("status") or "").upper() == "ACTIVE":
-                    all_active_products.append(node)
-        page_info = products_conn.get("pageInfo") or {}
-        if page_info.get("hasNextPage"):
-            after = page_info.get("endCursor")
-        else:
-            break
-
-    domain_component = _sanitize_filename_component(shop_domain)
+    products = _iter_active_products_bulk(client)
+    try:
+        # Bulk errors surface before the first record, so peek it here
+        first_product = next(products, None)
+    except ShopifyAPIError as e:
+        # e.g. another bulk operation is already running on this shop
+        print(f"Bulk export unavailable ({e}); falling back to paginated fetch")
+        products = _iter_active_products_paginated(client)
+        first_product = next(products, None)
+    if first_product is not None:
+        products = itertools.chain([first_product], products)
+
+    domain_component = sanitize_filename_component(shop_domain)
     out_path = os.path.join(os.path.dirname(__file__), f"../shopify_active_product_images_{domain_component}.txt")
     out_path = os.path.abspath(out_path)
 
-    lines: List[str] = []
-    lines.append(f"Shop Domain: {shop_domain}")
-    lines.append(f"Total ACTIVE Products: {len(all_active_products)}")
-    lines.append("")
-
-    for product in all_active_products:
-        lines.append(_format_product_images(product))
-
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
-
-    print(f"Saved ACTIVE product images for {len(all_active_products)} products to {out_path}")
+    # Stream each product to disk as it arrives; the total is patched into
+    # the fixed-width header line once known
+    count = 0
+    with open(out_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(f"Shop Domain: {shop_domain}\n")
+        count_pos = f.tell()
+        f.write(f"Total ACTIVE Products: {count:<10}\n\n")
+        for product in products:
+            _format_product_images(product, f)
+            f.write("\n")
+            count += 1
+        f.seek(count_pos)
+        f.write(f"Total ACTIVE Products: {count:<10}")
+
+    print(f"Saved ACTIVE product images for {count} products to {out_path}")
 
 
 if __name__ == "__main__":
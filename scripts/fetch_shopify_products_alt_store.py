@@ -20,12 +20,14 @@ Usage:
 
 import os
 import sys
-from typing import Dict, Any, List, Optional
+import itertools
+from typing import Dict, Any, Iterator, List, Optional, TextIO
 
 from dotenv import load_dotenv
 
 # Import the typed client
-from shopify_method import ShopifyClient
+from shopify_method import ShopifyClient, ShopifyAPIError
+from shopify_method.utils import group_bulk_records, sanitize_filename_component
 
 
 def _first_env(names: List[str], default: Optional[str] = None) -> Optional[str]:
@@ -36,17 +38,9 @@ def _first_env(names: List[str], default: Optional[str] = None) -> Optional[str]
     return default
 
 
-def _sanitize_filename_component(text: str) -> str:
-    sanitized = (text or "").strip().lower()
-    for ch in [" ", ".", "/", "\\", ":", "*", "?", "\"", "<", ">", "|"]:
-        sanitized = sanitized.replace(ch, "_")
-    sanitized = sanitized.replace("-", "_")
-    return sanitized[:80] or "store"
-
-
 PAGINATED_PRODUCTS_QUERY = """
-query getAllProducts($first: Int!, $after: String) {
-  products(first: $first, after: $after) {
+query getAllProducts($first: Int!, $after: String, $query: String) {
+  products(first: $first, after: $after, query: $query) {
     edges {
       cursor
       node {
@@ -86,34 +80,91 @@ query getAllProducts($first: Int!, $after: String) {
 }
 """
 
+# Same fields as above for a bulk export: no paging arguments, and every
+# image/variant comes back as its own JSONL record linked by __parentId
+BULK_PRODUCTS_QUERY = """
+{
+  products {
+    edges {
+      node {
+        id
+        title
+        handle
+        status
+        vendor
+        productType
+        tags
+        createdAt
+        updatedAt
+        images {
+          edges { node { id src altText } }
+        }
+        variants {
+          edges {
+            node {
+              id
+              title
+              price
+              compareAtPrice
+              sku
+              barcode
+              inventoryQuantity
+              availableForSale
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _iter_products_bulk(client: ShopifyClient) -> Iterator[Dict[str, Any]]:
+    """Stream all products from one bulk operation, re-nesting images/variants."""
+    for product, children in group_bulk_records(client.run_bulk_query(BULK_PRODUCTS_QUERY)):
+        image_edges = []
+        variant_edges = []
+        for child in children:
+            child_id = child.get("id") or ""
+            if child_id.startswith("gid://shopify/ProductVariant/"):
+                variant_edges.append({"node": child})
+            elif child_id.startswith("gid://shopify/ProductImage/"):
+                image_edges.append({"node": child})
+        product["images"] = {"edges": image_edges}
+        product["variants"] = {"edges": variant_edges}
+        yield product
+
+
+def _iter_products_paginated(client: ShopifyClient) -> Iterator[Dict[str, Any]]:
+    """Stream all products by paging id ranges concurrently (fallback when bulk operations are unavailable)."""
+    return client.iter_products_parallel(PAGINATED_PRODUCTS_QUERY)
 
-def _format_product(product: Dict[str, Any]) -> str:
-    lines: List[str] = []
-    lines.append(f"# {product.get('title')}")
-    lines.append(f"ID: {product.get('id')}  |  Handle: {product.get('handle')}  |  Status: {product.get('status')}")
-    lines.append(f"Vendor: {product.get('vendor')}  |  Type: {product.get('productType')}  |  Tags: {', '.join(product.get('tags') or [])}")
-    lines.append(f"Created: {product.get('createdAt')}  |  Updated: {product.get('updatedAt')}")
+
+def _format_product(product: Dict[str, Any], out: TextIO) -> None:
+    write = out.write
+    write(f"# {product.get('title')}\n")
+    write(f"ID: {product.get('id')}  |  Handle: {product.get('handle')}  |  Status: {product.get('status')}\n")
+    write(f"Vendor: {product.get('vendor')}  |  Type: {product.get('productType')}  |  Tags: {', '.join(product.get('tags') or [])}\n")
+    write(f"Created: {product.get('createdAt')}  |  Updated: {product.get('updatedAt')}\n")
 
     # Images summary
     images_conn = product.get('images') or {}
     image_edges = images_conn.get('edges') or []
-    lines.append(f"Images: {len(image_edges)}")
+    write(f"Images: {len(image_edges)}\n")
 
     # Variants table
     var_conn = product.get('variants') or {}
     var_edges = var_conn.get('edges') or []
     if var_edges:
-        lines.append("Variants:")
+        write("Variants:\n")
         for edge in var_edges:
             node = (edge or {}).get('node') or {}
-            lines.append(
-                f"  - {node.get('title')} | id={node.get('id')} | price={node.get('price')} | sku={node.get('sku')} | inv={node.get('inventoryQuantity')} | available={node.get('availableForSale')}"
+            write(
+                f"  - {node.get('title')} | id={node.get('id')} | price={node.get('price')} | sku={node.get('sku')} | inv={node.get('inventoryQuantity')} | available={node.get('availableForSale')}\n"
             )
     else:
-        lines.append("Variants: none")
-
-    lines.append("")
-    return "\n".join(lines)
+        write("Variants: none\n")
 
 
 def main() -> None:
@@ -132,42 +183,38 @@ def main() -> None:
 
     client = ShopifyClient(shop_domain=shop_domain, access_token=access_token)
 
-    all_products: List[Dict[str, Any]] = []
-    first = 50
-    after: Optional[str] = None
-
-    while True:
-        variables = {"first": first, "after": after}
-        data = client._make_graphql_request(PAGINATED_PRODUCTS_QUERY, variables)
-        products_conn = (data.get("data") or {}).get("products") or {}
-        edges = products_conn.get("edges") or []
-        for edge in edges:
-            node = (edge or {}).get("node")
-            if node:
-                all_products.append(node)
-        page_info = products_conn.get("pageInfo") or {}
-        if page_info.get("hasNextPage"):
-            after = page_info.get("endCursor")
-        else:
-            break
+    products = _iter_products_bulk(client)
+    try:
+        # Bulk errors surface before the first record, so peek it here
+        first_product = next(products, None)
+    except ShopifyAPIError as e:
+        # e.g. another bulk operation is already running on this shop
+        print(f"Bulk export unavailable ({e}); falling back to paginated fetch")
+        products = _iter_products_paginated(client)
+        first_product = next(products, None)
+    if first_product is not None:
+        products = itertools.chain([first_product], products)
 
     # Prepare output
-    domain_component = _sanitize_filename_component(shop_domain)
+    domain_component = sanitize_filename_component(shop_domain)
     out_path = os.path.join(os.path.dirname(__file__), f"../shopify_products_{domain_component}.txt")
     out_path = os.path.abspath(out_path)
 
-    lines: List[str] = []
-    lines.append(f"Shop Domain: {shop_domain}")
-    lines.append(f"Total Products: {len(all_products)}")
-    lines.append("")
-
-    for product in all_products:
-        lines.append(_format_product(product))
-
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
-
-    print(f"Saved {len(all_products)} products to {out_path}")
+    # Stream each product to disk as it arrives; the total is patched into
+    # the fixed-width header line once known
+    count = 0
+    with open(out_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(f"Shop Domain: {shop_domain}\n")
+        count_pos = f.tell()
+        f.write(f"Total Products: {count:<10}\n\n")
+        for product in products:
+            _format_product(product, f)
+            f.write("\n")
+            count += 1
+        f.seek(count_pos)
+        f.write(f"Total Products: {count:<10}")
+
+    print(f"Saved {count} products to {out_path}")
 
 
 if __name__ == "__main__":
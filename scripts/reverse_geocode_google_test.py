@@ -8,6 +8,8 @@ Usage: python scripts/reverse_geocode_google_test.py
 
 import os
 import sys
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List, Tuple
 
 try:
@@ -24,14 +26,46 @@ except Exception:
     pass
 
 
-def _component(components, *types) -> Optional[str]:
-    for c in components:
-        if any(t in c.get("types", []) for t in types):
-            return c.get("long_name")
+def _components_by_type(components) -> Dict[str, Tuple[int, Optional[str]]]:
+    """Index address components once: type -> (position, long_name) of its first component."""
+    by_type: Dict[str, Tuple[int, Optional[str]]] = {}
+    for i, c in enumerate(components):
+        for t in c.get("types", []):
+            by_type.setdefault(t, (i, c.get("long_name")))
+    return by_type
+
+
+def _component(by_type: Dict[str, Tuple[int, Optional[str]]], *types) -> Optional[str]:
+    # Earliest component carrying any of the types, as in a linear scan
+    hits = [by_type[t] for t in types if t in by_type]
+    return min(hits, key=lambda hit: hit[0])[1] if hits else None
+
+
+@functools.lru_cache(maxsize=None)
+def _gmaps_client(api_key: str) -> "googlemaps.Client":
+    # One client (and HTTP session) per key, so repeated lookups reuse connections
+    return googlemaps.Client(key=api_key)
+
+
+def _postal_code_lookup(gmaps: "googlemaps.Client", lat: float, lon: float, language: str) -> Optional[str]:
+    """Reverse lookup constrained to postal_code results."""
+    try:
+        res_pc = gmaps.reverse_geocode(latlng=(lat, lon), language=language, result_type=["postal_code"])
+        if res_pc:
+            comps_pc = _components_by_type(res_pc[0].get("address_components", []))
+            return _component(comps_pc, "postal_code")
+    except Exception:
+        pass
     return None
 
 
-def reverse_geocode(lat: float, lon: float, language: str = "en", region: Optional[str] = None) -> Dict[str, Any]:
+def reverse_geocode(
+    lat: float,
+    lon: float,
+    language: str = "en",
+    region: Optional[str] = None,
+    speculative: bool = False,
+) -> Dict[str, Any]:
     """Reverse-geocode lat/lon via Google APIs and return detailed, normalized fields.
 
     Strategy for building-level precision (best-effort):
@@ -41,12 +75,18 @@ def reverse_geocode(lat: float, lon: float, language: str = "en", region: Option
        - extra_computations: BUILDING_AND_ENTRANCES, ADDRESS_DESCRIPTORS (best-effort passthrough)
     2) If no street number or named building is found, fallback to Places Nearby (<= 30m)
        + Place Details to extract a building name to enrich the address.
+
+    The postal_code and Places Nearby fallbacks are billed requests, so by
+    default they are only sent when the main result lacks what they provide;
+    when both are needed they run in parallel. With speculative=True both are
+    sent alongside the main lookup (about one round-trip instead of two, at
+    the cost of always paying for both).
     """
     api_key = os.getenv("GOOGLE_MAPS_API")
     if not api_key:
         return {"success": False, "error": "Missing GOOGLE_MAPS_API env var"}
 
-    gmaps = googlemaps.Client(key=api_key)
+    gmaps = _gmaps_client(api_key)
     # Note: reverse_geocode supports post-filtering via result_type/location_type.
     # Region bias isn't supported on reverse_geocode in the python client.
     params: Dict[str, Any] = {
@@ -68,13 +108,20 @@ def reverse_geocode(lat: float, lon: float, language: str = "en", region: Option
     }
     # Do not pass 'region' here; not supported by googlemaps reverse_geocode
 
+    postal_code_future = nearby_future = None
+    if speculative:
+        executor = ThreadPoolExecutor(max_workers=2)
+        postal_code_future = executor.submit(_postal_code_lookup, gmaps, lat, lon, language)
+        nearby_future = executor.submit(_nearest_building_name, gmaps, lat, lon, language, region)
+        # Submitted lookups keep running; this only releases the threads afterwards
+        executor.shutdown(wait=False)
     res = gmaps.reverse_geocode(**params)
     if not res:
         return {"success": False, "error": "No results"}
 
     # Prefer the first ROOFTOP + building-level type if available
     r = _select_best_reverse_result(res)
-    comps = r.get("address_components", [])
+    comps = _components_by_type(r.get("address_components", []))
     norm = {
         "formatted": r.get("formatted_address"),
         "street_number": _component(comps, "street_number"),
@@ -97,20 +144,25 @@ def reverse_geocode(lat: float, lon: float, language: str = "en", region: Option
         "building_name": None,
     }
 
-    # Fallback: if postal code missing, try a second reverse lookup constrained to postal_code
-    if not norm["postal_code"]:
-        try:
-            res_pc = gmaps.reverse_geocode(latlng=(lat, lon), language=language, result_type=["postal_code"])
-            if res_pc:
-                comps_pc = res_pc[0].get("address_components", [])
-                pc = _component(comps_pc, "postal_code")
-                if pc:
-                    norm["postal_code"] = pc
-        except Exception:
-            pass
+    need_postal_code = not norm["postal_code"]
+    need_building = not norm.get("premise") or not norm.get("street_number")
+    # Send only the follow-ups this result needs (already in flight if speculative)
+    if need_postal_code and need_building and postal_code_future is None:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            postal_code_future = executor.submit(_postal_code_lookup, gmaps, lat, lon, language)
+            nearby_future = executor.submit(_nearest_building_name, gmaps, lat, lon, language, region)
+
+    # Fallback: if postal code missing, use the postal_code-constrained lookup
+    if need_postal_code:
+        pc = postal_code_future.result() if postal_code_future else _postal_code_lookup(gmaps, lat, lon, language)
+        if pc:
+            norm["postal_code"] = pc
     # Enrich with Place Details for building name if missing
-    if not norm.get("premise") or not norm.get("street_number"):
-        bname, bplace_id = _nearest_building_name(gmaps, lat, lon, language, region)
+    if need_building:
+        bname, bplace_id, bcomponents = (
+            nearby_future.result() if nearby_future
+            else _nearest_building_name(gmaps, lat, lon, language, region)
+        )
         if bname:
             norm["building_name"] = bname
             # If we didn't get a 'premise' from geocoder, store from Places
@@ -119,9 +171,10 @@ def reverse_geocode(lat: float, lon: float, language: str = "en", region: Option
             # If route is missing, try to read it from that place's details
             if not norm.get("route") and bplace_id:
                 try:
-                    p = gmaps.place(place_id=bplace_id, language=language, fields=["address_component"]) or {}
-                    ac = (p.get("result") or {}).get("address_components", [])
-                    maybe_route = _component(ac, "route")
+                    if bcomponents is None:
+                        p = gmaps.place(place_id=bplace_id, language=language, fields=["address_component"]) or {}
+                        bcomponents = (p.get("result") or {}).get("address_components", [])
+                    maybe_route = _component(_components_by_type(bcomponents), "route")
                     if maybe_route:
                         norm["route"] = maybe_route
                 except Exception:
@@ -176,10 +229,11 @@ def _nearest_building_name(
     lon: float,
     language: str,
     region: Optional[str] = None,
-) -> Tuple[Optional[str], Optional[str]]:
+) -> Tuple[Optional[str], Optional[str], Optional[List[Dict[str, Any]]]]:
     """Search very close-by Places to infer a building name when street numbers are missing.
 
-    Returns: (building_name, place_id)
+    Returns: (building_name, place_id, address_components or None if no
+    Place Details call was needed)
     """
     try:
         nearby = gmaps.places_nearby(
@@ -190,7 +244,7 @@ def _nearest_building_name(
         ) or {}
         candidates = nearby.get("results", [])
         if not candidates:
-            return None, None
+            return None, None, None
 
         # Prefer closer and with strong signals
         def nscore(place: Dict[str, Any]) -> Tuple[int, int, int]:
@@ -204,16 +258,21 @@ def _nearest_building_name(
         best = max(candidates, key=nscore)
         bname = best.get("name")
         bpid = best.get("place_id")
+        bcomponents = None
         # Validate/expand via Place Details when available
         if bpid and not bname:
             try:
-                details = gmaps.place(place_id=bpid, language=language, fields=["name"]) or {}
-                bname = (details.get("result") or {}).get("name")
+                # Ask for address components too, so a missing route can be
+                # filled from this same details call
+                details = gmaps.place(place_id=bpid, language=language, fields=["name", "address_component"]) or {}
+                result = details.get("result") or {}
+                bname = result.get("name")
+                bcomponents = result.get("address_components", [])
             except Exception:
                 pass
-        return (bname, bpid)
+        return (bname, bpid, bcomponents)
     except Exception:
-        return None, None
+        return None, None, None
 
 
 def main() -> int:
@@ -5,20 +5,90 @@ Quick reverse-geocoding test using geopy + Nominatim.
 Usage: python scripts/reverse_geocode_test.py
 """
 
+import functools
+import os
+import shelve
 import sys
-from typing import Dict, Any
+import time
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+# Nominatim's usage policy asks clients to cache results on their side. Entries
+# are keyed on coordinates rounded to 5 decimals (~1 m) plus the request options.
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".revgeo_cache")
+CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+# Map/directions link templates, filled with {lat} and {lon}
+GMAPS_PLACE_TMPL = "https://www.google.com/maps?q={lat},{lon}"
+GMAPS_DIR_TMPL = "https://www.google.com/maps/dir/?api=1&destination={lat}%2C{lon}&travelmode=driving"
+OSM_MAP_TMPL = "https://www.openstreetmap.org/?mlat={lat}&mlon={lon}#map=18/{lat}/{lon}"
+MAP_LINK_TEMPLATES: Tuple[Tuple[str, str], ...] = (
+    ("Google Maps (place)", GMAPS_PLACE_TMPL),
+    ("Google Maps (directions to)", GMAPS_DIR_TMPL),
+    ("OpenStreetMap (map)", OSM_MAP_TMPL),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _nominatim_reverse() -> Callable[..., Any]:
+    """Shared Nominatim reverse callable, throttled to OSM's 1 request/second
+    policy and retried with a pause on transient errors (timeouts, 5xx).
+    geopy is imported here so cache hits never pay for loading it."""
+    try:
+        from geopy.adapters import RequestsAdapter
+        from geopy.extra.rate_limiter import RateLimiter
+        from geopy.geocoders import Nominatim
+    except Exception:
+        print('geopy is not installed. Please install with: pip install "geopy[requests]"', file=sys.stderr)
+        raise
+
+    # Pin the requests-based adapter: its pooled Session keeps the connection
+    # to nominatim.openstreetmap.org alive across lookups
+    geolocator = Nominatim(user_agent="swiftreplies-revgeo-test", adapter_factory=RequestsAdapter)
+    return RateLimiter(
+        geolocator.reverse,
+        min_delay_seconds=1.0,
+        max_retries=3,
+        error_wait_seconds=2.0,
+        swallow_exceptions=False,
+    )
+
+
+def reverse_lookup_raw(lat: float, lon: float, language: str = "en", zoom: int = 18) -> Optional[Dict[str, Any]]:
+    """Return Nominatim's raw reverse-geocode payload, served from the disk cache while fresh."""
+    key = f"{round(lat, 5)},{round(lon, 5)},{language},{zoom}"
+    with shelve.open(CACHE_PATH) as cache:
+        entry = cache.get(key)
+        if entry and time.time() - entry["ts"] < CACHE_TTL_SECONDS:
+            return entry["raw"]
+
+        # Request richer details from Nominatim
+        location = _nominatim_reverse()(
+            (lat, lon), language=language, timeout=15, addressdetails=True, namedetails=True, zoom=zoom
+        )
+        if not location:
+            return None
+
+        raw = location.raw if isinstance(location.raw, dict) else {}
+        cache[key] = {"ts": time.time(), "raw": raw}
+        return raw
 
-try:
-    from geopy.geocoders import Nominatim
-except Exception as e:
-    print("geopy is not installed. Please install with: pip install geopy", file=sys.stderr)
-    raise
+
+# Nominatim address keys tried in order (first non-empty wins) per normalized field
+_FIELD_PRIORITY: Dict[str, Tuple[str, ...]] = {
+    # Fallback only; address1 is normally composed from building/house number/road
+    "address1": ("road", "residential", "pedestrian", "path", "footway", "cycleway"),
+    "address2": ("neighbourhood", "suburb", "hamlet", "residential"),
+    "city": ("city", "town", "village", "municipality", "county"),
+    "province": ("state", "region"),
+    "country": ("country",),
+    "postal_code": ("postcode",),
+}
 
 
 def normalize_address(addr: Dict[str, Any]) -> Dict[str, Any]:
     """Normalize Nominatim address dict to common fields."""
-    def pick(*keys):
-        for k in keys:
+    def pick(field):
+        for k in _FIELD_PRIORITY[field]:
             v = addr.get(k)
             if v:
                 return v
@@ -28,7 +98,7 @@ def normalize_address(addr: Dict[str, Any]) -> Dict[str, Any]:
     address1 = " ".join(
         filter(
             None,
-            [
+            (
                 addr.get("building"),
                 addr.get("house_number"),
                 addr.get("road")
@@ -36,28 +106,28 @@ def normalize_address(addr: Dict[str, Any]) -> Dict[str, Any]:
                 or addr.get("pedestrian")
                 or addr.get("footway")
                 or addr.get("path"),
-            ],
+            ),
         )
     ).strip()
     if not address1:
-        address1 = pick("road", "residential", "pedestrian", "path", "footway", "cycleway")
-
-    address2 = pick("neighbourhood", "suburb", "hamlet", "residential")
-    city = pick("city", "town", "village", "municipality", "county")
-    province = pick("state", "region")
-    country = pick("country")
-    postal_code = pick("postcode")
+        address1 = pick("address1")
 
     return {
         "address1": address1,
-        "address2": address2,
-        "city": city,
-        "province": province,
-        "country": country,
-        "postal_code": postal_code,
+        "address2": pick("address2"),
+        "city": pick("city"),
+        "province": pick("province"),
+        "country": pick("country"),
+        "postal_code": pick("postal_code"),
     }
 
 
+def map_links(lat: float, lon: float) -> List[Tuple[str, str]]:
+    """Return (label, url) pairs for viewing/navigating to the coordinates."""
+    coords = {"lat": lat, "lon": lon}
+    return [(label, tmpl.format_map(coords)) for label, tmpl in MAP_LINK_TEMPLATES]
+
+
 def main() -> int:
     # Provided coordinates
     lat = 34.001084
@@ -65,20 +135,17 @@ def main() -> int:
 
     print(f"Testing reverse geocode for: lat={lat}, lon={lon}")
 
-    geolocator = Nominatim(user_agent="swiftreplies-revgeo-test")
-    # Request richer details from Nominatim
-    location = geolocator.reverse(
-        (lat, lon), language="en", timeout=15, addressdetails=True, namedetails=True, zoom=18
-    )
+    raw = reverse_lookup_raw(lat, lon, language="en", zoom=18)
 
-    if not location:
+    if raw is None:
         print("No result from Nominatim")
         return 1
 
+    display_name = raw.get("display_name")
     print("\nFull formatted (provider display_name):")
-    print(location.address)
+    print(display_name)
 
-    addr = location.raw.get("address", {}) if isinstance(location.raw, dict) else {}
+    addr = raw.get("address", {})
     norm = normalize_address(addr)
 
     print("\nNormalized components (street-level):")
@@ -86,24 +153,20 @@ def main() -> int:
         print(f"- {k}: {v}")
 
     # Build a human-friendly full street address line from normalized components
-    parts = [
+    parts = (
         norm.get("address1"),
         norm.get("address2"),
-        ", ".join(filter(None, [norm.get("city"), norm.get("province")])),
+        ", ".join(filter(None, (norm.get("city"), norm.get("province")))),
         norm.get("postal_code"),
         norm.get("country"),
-    ]
-    full_street_address = ", ".join([p for p in parts if p])
+    )
+    full_street_address = ", ".join(filter(None, parts))
     print("\nFull street address (normalized):")
-    print(full_street_address or location.address)
+    print(full_street_address or display_name)
 
-    gmaps_place_url = f"https://www.google.com/maps?q={lat},{lon}"
-    gmaps_dir_url = f"https://www.google.com/maps/dir/?api=1&destination={lat}%2C{lon}&travelmode=driving"
-    osm_map_url = f"https://www.openstreetmap.org/?mlat={lat}&mlon={lon}#map=18/{lat}/{lon}"
     print("\nMap & directions:")
-    print(f"- Google Maps (place): {gmaps_place_url}")
-    print(f"- Google Maps (directions to): {gmaps_dir_url}")
-    print(f"- OpenStreetMap (map): {osm_map_url}")
+    for label, url in map_links(lat, lon):
+        print(f"- {label}: {url}")
 
     # Brief notes
     print("\nNotes:")
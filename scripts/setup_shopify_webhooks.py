@@ -7,22 +7,43 @@ This script creates webhook subscriptions for product create, update, and delete
 import os
 import sys
 import json
-from typing import Dict, Any, Optional, List
+import functools
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple
 import logging
-from dotenv import load_dotenv
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from shopify_method import ShopifyClient
-
-# Load environment variables
-load_dotenv()
+if TYPE_CHECKING:
+    from shopify_method import ShopifyClient
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Upper bound on webhook mutations sent to Shopify at once
+MAX_CONCURRENT_MUTATIONS = 8
+
+# Aliased deletes per request; each costs 10 points, well under the 1000 query limit
+MAX_DELETES_PER_MUTATION = 25
+
+
+@functools.lru_cache(maxsize=None)
+def _shopify_credentials() -> Tuple[Optional[str], Optional[str]]:
+    """Load .env on first use and read the Shopify credentials once."""
+    from dotenv import load_dotenv
+    load_dotenv()
+    return os.getenv('SHOPIFY_SHOP_DOMAIN'), os.getenv('SHOPIFY_ACCESS_TOKEN')
+
+
+@functools.lru_cache(maxsize=None)
+def _get_shopify_client(shop_domain: str, access_token: str) -> "ShopifyClient":
+    """One ShopifyClient (and pooled session) per store, shared by every manager."""
+    from shopify_method import ShopifyClient
+    return ShopifyClient(shop_domain=shop_domain, access_token=access_token)
+
 # GraphQL mutation for creating webhook subscriptions
 WEBHOOK_SUBSCRIPTION_MUTATION = """
 mutation webhookSubscriptionCreate($topic: WebhookSubscriptionTopic!, $webhookSubscription: WebhookSubscriptionInput!) {
@@ -46,10 +67,14 @@ mutation webhookSubscriptionCreate($topic: WebhookSubscriptionTopic!, $webhookSu
 }
 """
 
-# GraphQL query to list existing webhooks
+# GraphQL query to list existing webhooks (paged at the 250 maximum)
 LIST_WEBHOOKS_QUERY = """
-query {
-  webhookSubscriptions(first: 50) {
+query listWebhooks($cursor: String) {
+  webhookSubscriptions(first: 250, after: $cursor) {
+    pageInfo {
+      hasNextPage
+      endCursor
+    }
     edges {
       node {
         id
@@ -80,6 +105,18 @@ mutation webhookSubscriptionDelete($id: ID!) {
 }
 """
 
+
+@functools.lru_cache(maxsize=None)
+def _bulk_delete_mutation(count: int) -> str:
+    """Build a mutation deleting ``count`` subscriptions, aliased d0..d{count-1}."""
+    params = ", ".join(f"$id{i}: ID!" for i in range(count))
+    fields = " ".join(
+        f"d{i}: webhookSubscriptionDelete(id: $id{i}) "
+        f"{{ userErrors {{ field message }} deletedWebhookSubscriptionId }}"
+        for i in range(count)
+    )
+    return f"mutation webhookSubscriptionDeleteBulk({params}) {{ {fields} }}"
+
 class ShopifyWebhookManager:
     """Manager for Shopify webhook operations."""
     
@@ -90,19 +127,20 @@ class ShopifyWebhookManager:
         Args:
             webhook_url: The public URL where webhooks will be sent
         """
-        # Get Shopify credentials from environment
-        self.shop_domain = os.getenv('SHOPIFY_SHOP_DOMAIN')
-        self.access_token = os.getenv('SHOPIFY_ACCESS_TOKEN')
+        # Shopify credentials from environment
+        self.shop_domain, self.access_token = _shopify_credentials()
         self.webhook_url = webhook_url
         
         if not self.shop_domain or not self.access_token:
             raise ValueError("Missing SHOPIFY_SHOP_DOMAIN or SHOPIFY_ACCESS_TOKEN in environment variables")
             
-        # Initialize Shopify client
-        self.client = ShopifyClient(
-            shop_domain=self.shop_domain,
-            access_token=self.access_token
-        )
+        # Shared Shopify client
+        self.client = _get_shopify_client(self.shop_domain, self.access_token)
+        
+        # Webhook list from the last list_existing_webhooks call and its
+        # callback URL index; cleared whenever a subscription is created or deleted
+        self._webhook_cache: Optional[List[Dict[str, Any]]] = None
+        self._webhooks_by_url: Optional[Dict[Optional[str], List[Dict[str, Any]]]] = None
         
         # Product topics we want to subscribe to
         self.product_topics = [
@@ -111,42 +149,81 @@ class ShopifyWebhookManager:
             "PRODUCTS_DELETE"
         ]
         
-        logger.info(f"Initialized webhook manager for {self.shop_domain}")
-        logger.info(f"Webhook URL: {self.webhook_url}")
+        logger.info("Initialized webhook manager for %s", self.shop_domain)
+        logger.info("Webhook URL: %s", self.webhook_url)
     
-    def list_existing_webhooks(self) -> List[Dict[str, Any]]:
-        """List all existing webhook subscriptions."""
+    def list_existing_webhooks(self, use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        List all existing webhook subscriptions.
+        
+        Args:
+            use_cache: If True, reuse the list fetched earlier by this manager
+                (until a subscription is created or deleted)
+        """
+        if use_cache and self._webhook_cache is not None:
+            return list(self._webhook_cache)
+        
         try:
-            response = self.client._make_graphql_request(LIST_WEBHOOKS_QUERY)
-            
-            if 'errors' in response:
-                logger.error(f"GraphQL errors: {response['errors']}")
-                return []
-            
             webhooks = []
-            edges = response.get('data', {}).get('webhookSubscriptions', {}).get('edges', [])
+            variables: Dict[str, Any] = {"cursor": None}
             
-            for edge in edges:
-                node = edge.get('node', {})
-                webhook_info = {
-                    'id': node.get('id'),
-                    'topic': node.get('topic'),
-                    'format': node.get('format'),
-                    'callback_url': None
-                }
+            while True:
+                response = self.client._make_graphql_request(LIST_WEBHOOKS_QUERY, variables)
                 
-                endpoint = node.get('endpoint', {})
-                if endpoint.get('__typename') == 'WebhookHttpEndpoint':
-                    webhook_info['callback_url'] = endpoint.get('callbackUrl')
+                if 'errors' in response:
+                    logger.error("GraphQL errors: %s", response['errors'])
+                    return []
                 
-                webhooks.append(webhook_info)
+                connection = response.get('data', {}).get('webhookSubscriptions', {})
+                for edge in connection.get('edges', []):
+                    node = edge.get('node', {})
+                    webhook_info = {
+                        'id': node.get('id'),
+                        'topic': node.get('topic'),
+                        'format': node.get('format'),
+                        'callback_url': None
+                    }
+                    
+                    endpoint = node.get('endpoint', {})
+                    if endpoint.get('__typename') == 'WebhookHttpEndpoint':
+                        webhook_info['callback_url'] = endpoint.get('callbackUrl')
+                    
+                    webhooks.append(webhook_info)
+                
+                page_info = connection.get('pageInfo', {})
+                if not page_info.get('hasNextPage'):
+                    break
+                variables["cursor"] = page_info.get('endCursor')
             
-            return webhooks
+            self._webhook_cache = webhooks
+            self._webhooks_by_url = None
+            return list(webhooks)
             
         except Exception as e:
-            logger.error(f"Error listing webhooks: {e}")
+            logger.error("Error listing webhooks: %s", e)
             return []
     
+    def webhooks_for_callback_url(self, callback_url: str) -> List[Dict[str, Any]]:
+        """
+        List existing webhook subscriptions delivering to the given callback URL.
+        
+        Args:
+            callback_url: Exact callback URL to match
+            
+        Returns:
+            Matching webhooks, looked up in an index built once per fetched list
+        """
+        if self._webhooks_by_url is None or self._webhook_cache is None:
+            by_url: Dict[Optional[str], List[Dict[str, Any]]] = defaultdict(list)
+            for webhook in self.list_existing_webhooks():
+                by_url[webhook['callback_url']].append(webhook)
+            self._webhooks_by_url = dict(by_url)
+        return list(self._webhooks_by_url.get(callback_url, []))
+    
+    def _invalidate_webhook_cache(self) -> None:
+        self._webhook_cache = None
+        self._webhooks_by_url = None
+    
     def get_webhook_stats(self) -> Dict[str, Any]:
         """
         Compute statistics about existing webhook subscriptions, including duplicates.
@@ -158,23 +235,15 @@ class ShopifyWebhookManager:
             webhooks = self.list_existing_webhooks()
             total = len(webhooks)
 
-            by_topic: Dict[str, int] = {}
-            by_callback: Dict[str, int] = {}
-            pair_counts: Dict[str, int] = {}
-
-            for wh in webhooks:
-                topic = wh.get('topic') or 'UNKNOWN'
-                cb = wh.get('callback_url') or 'NONE'
-                by_topic[topic] = by_topic.get(topic, 0) + 1
-                by_callback[cb] = by_callback.get(cb, 0) + 1
-                key = f"{topic}@@{cb}"
-                pair_counts[key] = pair_counts.get(key, 0) + 1
+            pairs = [(wh.get('topic') or 'UNKNOWN', wh.get('callback_url') or 'NONE') for wh in webhooks]
+            by_topic = Counter(topic for topic, _ in pairs)
+            by_callback = Counter(cb for _, cb in pairs)
+            pair_counts = Counter(pairs)
 
             duplicates: List[Dict[str, Any]] = []
             duplicate_count = 0
-            for key, cnt in pair_counts.items():
+            for (topic, cb), cnt in pair_counts.items():
                 if cnt > 1:
-                    topic, cb = key.split('@@', 1)
                     duplicates.append({
                         'topic': topic,
                         'callback_url': cb,
@@ -184,13 +253,13 @@ class ShopifyWebhookManager:
 
             return {
                 'total': total,
-                'by_topic': by_topic,
-                'by_callback_url': by_callback,
+                'by_topic': dict(by_topic),
+                'by_callback_url': dict(by_callback),
                 'duplicate_pairs': duplicates,
                 'duplicate_excess': duplicate_count,
             }
         except Exception as e:
-            logger.error(f"Error computing webhook stats: {e}")
+            logger.error("Error computing webhook stats: %s", e)
             return {
                 'total': 0,
                 'by_topic': {},
@@ -222,28 +291,29 @@ class ShopifyWebhookManager:
             response = self.client._make_graphql_request(WEBHOOK_SUBSCRIPTION_MUTATION, variables)
             
             if 'errors' in response:
-                logger.error(f"GraphQL errors creating webhook for {topic}: {response['errors']}")
+                logger.error("GraphQL errors creating webhook for %s: %s", topic, response['errors'])
                 return None
             
             data = response.get('data', {}).get('webhookSubscriptionCreate', {})
             user_errors = data.get('userErrors', [])
             
             if user_errors:
-                logger.error(f"User errors creating webhook for {topic}: {user_errors}")
+                logger.error("User errors creating webhook for %s: %s", topic, user_errors)
                 return None
             
             subscription = data.get('webhookSubscription')
             if subscription:
-                logger.info(f"✅ Created webhook subscription for {topic}")
-                logger.info(f"   ID: {subscription.get('id')}")
-                logger.info(f"   Callback URL: {subscription.get('endpoint', {}).get('callbackUrl')}")
+                self._invalidate_webhook_cache()
+                logger.info("✅ Created webhook subscription for %s", topic)
+                logger.info("   ID: %s", subscription.get('id'))
+                logger.info("   Callback URL: %s", subscription.get('endpoint', {}).get('callbackUrl'))
                 return subscription
             else:
-                logger.error(f"No subscription returned for {topic}")
+                logger.error("No subscription returned for %s", topic)
                 return None
                 
         except Exception as e:
-            logger.error(f"Error creating webhook for {topic}: {e}")
+            logger.error("Error creating webhook for %s: %s", topic, e)
             return None
     
     def delete_webhook_subscription(self, webhook_id: str) -> bool:
@@ -262,28 +332,86 @@ class ShopifyWebhookManager:
             response = self.client._make_graphql_request(DELETE_WEBHOOK_MUTATION, variables)
             
             if 'errors' in response:
-                logger.error(f"GraphQL errors deleting webhook {webhook_id}: {response['errors']}")
+                logger.error("GraphQL errors deleting webhook %s: %s", webhook_id, response['errors'])
                 return False
             
             data = response.get('data', {}).get('webhookSubscriptionDelete', {})
             user_errors = data.get('userErrors', [])
             
             if user_errors:
-                logger.error(f"User errors deleting webhook {webhook_id}: {user_errors}")
+                logger.error("User errors deleting webhook %s: %s", webhook_id, user_errors)
                 return False
             
             deleted_id = data.get('deletedWebhookSubscriptionId')
             if deleted_id:
-                logger.info(f"✅ Deleted webhook subscription: {deleted_id}")
+                self._invalidate_webhook_cache()
+                logger.info("✅ Deleted webhook subscription: %s", deleted_id)
                 return True
             else:
-                logger.error(f"Failed to delete webhook {webhook_id}")
+                logger.error("Failed to delete webhook %s", webhook_id)
                 return False
                 
         except Exception as e:
-            logger.error(f"Error deleting webhook {webhook_id}: {e}")
+            logger.error("Error deleting webhook %s: %s", webhook_id, e)
             return False
     
+    def _delete_webhook_batch(self, webhook_ids: List[str]) -> List[bool]:
+        """
+        Delete up to MAX_DELETES_PER_MUTATION subscriptions in one aliased mutation.
+        
+        Falls back to one request per webhook if the batched request fails
+        (e.g. throttled), so a single bad batch does not abort the cleanup.
+        
+        Args:
+            webhook_ids: Webhook subscription IDs
+            
+        Returns:
+            Deletion outcome per ID, in input order
+        """
+        variables = {f"id{i}": webhook_id for i, webhook_id in enumerate(webhook_ids)}
+        try:
+            response = self.client._make_graphql_request(_bulk_delete_mutation(len(webhook_ids)), variables)
+        except Exception as e:
+            logger.warning("Batched delete of %s webhooks failed (%s); retrying one at a time", len(webhook_ids), e)
+            return [self.delete_webhook_subscription(webhook_id) for webhook_id in webhook_ids]
+        
+        data = response.get('data') or {}
+        outcomes = []
+        for i, webhook_id in enumerate(webhook_ids):
+            payload = data.get(f"d{i}") or {}
+            user_errors = payload.get('userErrors', [])
+            if user_errors:
+                logger.error("User errors deleting webhook %s: %s", webhook_id, user_errors)
+                outcomes.append(False)
+            elif payload.get('deletedWebhookSubscriptionId'):
+                logger.info("✅ Deleted webhook subscription: %s", payload['deletedWebhookSubscriptionId'])
+                outcomes.append(True)
+            else:
+                logger.error("Failed to delete webhook %s", webhook_id)
+                outcomes.append(False)
+        
+        if any(outcomes):
+            self._invalidate_webhook_cache()
+        return outcomes
+    
+    def delete_webhook_subscriptions(self, webhooks: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], bool]]:
+        """
+        Delete several webhook subscriptions, batching aliased deletes per request.
+        
+        Args:
+            webhooks: Webhook entries as returned by list_existing_webhooks
+            
+        Returns:
+            (webhook, deleted) pairs in input order
+        """
+        if not webhooks:
+            return []
+        ids = [webhook['id'] for webhook in webhooks]
+        batches = [ids[i:i + MAX_DELETES_PER_MUTATION] for i in range(0, len(ids), MAX_DELETES_PER_MUTATION)]
+        with ThreadPoolExecutor(max_workers=min(len(batches), MAX_CONCURRENT_MUTATIONS)) as executor:
+            outcomes = [deleted for batch in executor.map(self._delete_webhook_batch, batches) for deleted in batch]
+        return list(zip(webhooks, outcomes))
+    
     def setup_product_webhooks(self, replace_existing: bool = False) -> Dict[str, Any]:
         """
         Setup webhooks for all product events.
@@ -308,26 +436,43 @@ class ShopifyWebhookManager:
         results['existing_webhooks'] = existing_webhooks
         
         if existing_webhooks:
-            logger.info(f"Found {len(existing_webhooks)} existing webhooks:")
+            logger.info("Found %s existing webhooks:", len(existing_webhooks))
             for webhook in existing_webhooks:
-                logger.info(f"  - {webhook['topic']}: {webhook['callback_url']} (ID: {webhook['id']})")
+                logger.info("  - %s: %s (ID: %s)", webhook['topic'], webhook['callback_url'], webhook['id'])
         
         # Delete existing webhooks for our URL if requested
+        ours = self.webhooks_for_callback_url(self.webhook_url)
         if replace_existing:
             logger.info("🗑️ Deleting existing webhooks for our URL...")
-            for webhook in existing_webhooks:
-                if webhook['callback_url'] == self.webhook_url:
-                    if self.delete_webhook_subscription(webhook['id']):
-                        results['deleted_webhooks'].append(webhook)
+            kept = []
+            for webhook, deleted in self.delete_webhook_subscriptions(ours):
+                if deleted:
+                    results['deleted_webhooks'].append(webhook)
+                else:
+                    kept.append(webhook)
+            ours = kept
         
-        # Create new webhooks for product topics
-        logger.info("🔗 Creating new webhook subscriptions...")
+        # Topics already subscribed to our URL need no new mutation
+        existing_by_topic = {webhook['topic']: webhook for webhook in ours}
+        topics_to_create = []
         for topic in self.product_topics:
-            subscription = self.create_webhook_subscription(topic)
-            if subscription:
-                results['created_webhooks'].append(subscription)
+            webhook = existing_by_topic.get(topic)
+            if webhook:
+                logger.info("⏭️ %s already delivers to our URL (ID: %s)", topic, webhook['id'])
+                results['created_webhooks'].append({**webhook, 'already_existed': True})
             else:
-                results['failed_creations'].append(topic)
+                topics_to_create.append(topic)
+        
+        # Create new webhooks for product topics (independent, so sent concurrently)
+        if topics_to_create:
+            logger.info("🔗 Creating new webhook subscriptions...")
+            with ThreadPoolExecutor(max_workers=len(topics_to_create)) as executor:
+                subscriptions = list(executor.map(self.create_webhook_subscription, topics_to_create))
+            for topic, subscription in zip(topics_to_create, subscriptions):
+                if subscription:
+                    results['created_webhooks'].append(subscription)
+                else:
+                    results['failed_creations'].append(topic)
         
         # Check if setup was successful
         results['success'] = (
@@ -351,14 +496,12 @@ class ShopifyWebhookManager:
         }
         
         logger.info("🧹 Cleaning up webhooks for our URL...")
-        existing_webhooks = self.list_existing_webhooks()
-        
-        for webhook in existing_webhooks:
-            if webhook['callback_url'] == self.webhook_url:
-                if self.delete_webhook_subscription(webhook['id']):
-                    results['deleted_webhooks'].append(webhook)
-                else:
-                    results['failed_deletions'].append(webhook)
+        ours = self.webhooks_for_callback_url(self.webhook_url)
+        for webhook, deleted in self.delete_webhook_subscriptions(ours):
+            if deleted:
+                results['deleted_webhooks'].append(webhook)
+            else:
+                results['failed_deletions'].append(webhook)
         
         results['success'] = len(results['failed_deletions']) == 0
         return results
@@ -380,20 +523,21 @@ class ShopifyWebhookManager:
             'success': False
         }
         try:
-            logger.info(f"🔍 Pruning webhooks where callback URL contains: '{substring}'")
+            logger.info("🔍 Pruning webhooks where callback URL contains: '%s'", substring)
             existing_webhooks = self.list_existing_webhooks()
-            for webhook in existing_webhooks:
-                cb = webhook.get('callback_url') or ''
-                if substring in cb:
-                    results['matched_webhooks'].append(webhook)
-                    if self.delete_webhook_subscription(webhook['id']):
-                        results['deleted_webhooks'].append(webhook)
-                    else:
-                        results['failed_deletions'].append(webhook)
+            results['matched_webhooks'] = [
+                webhook for webhook in existing_webhooks
+                if substring in (webhook.get('callback_url') or '')
+            ]
+            for webhook, deleted in self.delete_webhook_subscriptions(results['matched_webhooks']):
+                if deleted:
+                    results['deleted_webhooks'].append(webhook)
+                else:
+                    results['failed_deletions'].append(webhook)
             results['success'] = len(results['failed_deletions']) == 0
             return results
         except Exception as e:
-            logger.error(f"Error pruning webhooks: {e}")
+            logger.error("Error pruning webhooks: %s", e)
             results['error'] = str(e)
             return results
 
@@ -454,7 +598,8 @@ def main():
             if results['created_webhooks']:
                 print(f"\n✅ Successfully created webhooks:")
                 for webhook in results['created_webhooks']:
-                    print(f"  - {webhook['topic']}: {webhook['id']}")
+                    note = " (already existed)" if webhook.get('already_existed') else ""
+                    print(f"  - {webhook['topic']}: {webhook['id']}{note}")
             
             if results['failed_creations']:
                 print(f"\n❌ Failed to create webhooks for:")
@@ -496,7 +641,7 @@ def main():
         print(f"  Action: {args.action}")
         
     except Exception as e:
-        logger.error(f"Script failed: {e}", exc_info=True)
+        logger.error("Script failed: %s", e, exc_info=True)
         sys.exit(1)
 
 
@@ -23,14 +23,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.astrosouks_tools.astrosouks_inventory_tool import check_astrosouks_inventory
-
-
-def _sanitize_filename_component(text: str) -> str:
-    sanitized = (text or "").strip().lower()
-    for ch in [" ", ".", "/", "\\", ":", "*", "?", "\"", "<", ">", "|"]:
-        sanitized = sanitized.replace(ch, "_")
-    sanitized = sanitized.replace("-", "_")
-    return sanitized[:80] or "store"
+from shopify_method.utils import sanitize_filename_component
 
 
 def main() -> None:
@@ -45,7 +38,7 @@ def main() -> None:
 
     # Save to project root
     root = Path(__file__).resolve().parents[1]
-    domain_component = _sanitize_filename_component(shop_domain)
+    domain_component = sanitize_filename_component(shop_domain)
     out_path = root / f"astrosouks_active_inventory_{domain_component}.txt"
     out_path.write_text((result_txt or "") + "\n", encoding="utf-8")
     print(f"Saved inventory output to: {out_path}")
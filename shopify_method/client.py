@@ -4,10 +4,14 @@ Main ShopifyClient class for interacting with Shopify GraphQL Admin API.
 
 import json
 import time
+import queue
 import logging
+import threading
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Iterator, Optional, List, Union
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 
 from .exceptions import (
     ShopifyAPIError,
@@ -20,12 +24,20 @@ from .exceptions import (
     InventoryError,
     OrderError,
 )
-from .utils import format_graphql_id, extract_id_from_gid
+from .utils import format_graphql_id, extract_id_from_gid, extract_edges_nodes, minify_graphql
 from .constants import (
     DEFAULT_API_VERSION,
     MAX_RETRIES,
     RETRY_BASE_DELAY,
     REQUEST_TIMEOUT,
+    HTTP_POOL_MAXSIZE,
+    BULK_POLL_INTERVAL,
+    BULK_MAX_POLL_INTERVAL,
+    BULK_OPERATION_TIMEOUT,
+    MAX_NODES_PER_QUERY,
+    BULK_OPERATION_RUN_QUERY_MUTATION,
+    CURRENT_BULK_OPERATION_QUERY,
+    PRODUCT_ID_BOUNDS_QUERY,
 )
 
 
@@ -56,6 +68,10 @@ class ShopifyClient:
         
         # Initialize session for connection pooling
         self.session = requests.Session()
+        # Size the keep-alive pool for the threaded helpers (parallel paging,
+        # concurrent mutations) so connections are reused, not discarded; retries
+        # stay in _make_graphql_request, which knows Shopify's throttling rules
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE))
         self.session.headers.update({
             'Content-Type': 'application/json',
             'X-Shopify-Access-Token': access_token,
@@ -99,9 +115,11 @@ class ShopifyClient:
         Raises:
             Various ShopifyAPI exceptions based on error type
         """
-        payload = {"query": query}
+        payload = {"query": minify_graphql(query)}
         if variables:
             payload["variables"] = variables
+        # Serialize once (compact) and reuse the bytes across retries
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
         
         last_exception = None
         
@@ -111,7 +129,7 @@ class ShopifyClient:
                 
                 response = self.session.post(
                     self.base_url,
-                    json=payload,
+                    data=body,
                     timeout=REQUEST_TIMEOUT
                 )
                 
@@ -986,6 +1004,246 @@ class ShopifyClient:
             self.logger.error(f"Error getting full products: {str(e)}")
             return self._format_response(False, error=str(e))
     
+    def get_nodes(self, ids: List[str], selection: str,
+                  batch_size: int = MAX_NODES_PER_QUERY) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch many objects by global id with one nodes(ids: ...) query per batch.
+        
+        Use this instead of one get_* call per object inside a loop (e.g. the
+        descriptions of a list of products): N lookups cost ceil(N / batch_size)
+        requests instead of N.
+        
+        Args:
+            ids (List[str]): Global ids (gid://shopify/...)
+            selection (str): Fields selected on each node, e.g. '... on Product { descriptionHtml }'
+            batch_size (int): Ids per request (Shopify accepts at most 250)
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Nodes keyed by id; ids that do not resolve are omitted
+        """
+        query = f"query getNodes($ids: [ID!]!) {{ nodes(ids: $ids) {{ id {selection} }} }}"
+        
+        nodes: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(ids), batch_size):
+            data = self._make_graphql_request(query, {"ids": ids[start:start + batch_size]})
+            for node in (data.get('data') or {}).get('nodes') or []:
+                if node:
+                    nodes[node['id']] = node
+        return nodes
+    
+    def run_bulk_query(self, query: str, timeout: float = BULK_OPERATION_TIMEOUT) -> Iterator[Dict[str, Any]]:
+        """
+        Run a query as a bulk operation and stream its result records.
+        
+        Shopify runs the export server-side, so a whole catalog costs one
+        mutation plus a few status polls instead of one request per page.
+        Nested connections come back as separate records linked by
+        '__parentId' (see utils.group_bulk_records).
+        
+        Args:
+            query (str): Bulk query (no first/after arguments on connections)
+            timeout (float): Maximum seconds to wait for the export
+            
+        Returns:
+            Iterator[Dict[str, Any]]: Parsed JSONL records in file order
+            
+        Raises:
+            ShopifyAPIError: If the operation cannot start, fails, times out,
+                or is replaced by another bulk operation while polling
+        """
+        response = self._make_graphql_request(BULK_OPERATION_RUN_QUERY_MUTATION, {"query": query})
+        result = response.get('data', {}).get('bulkOperationRunQuery') or {}
+        user_errors = result.get('userErrors') or []
+        if user_errors:
+            messages = [error.get('message', str(error)) for error in user_errors]
+            raise GraphQLError("Bulk operation could not start", errors=messages)
+        operation_id = (result.get('bulkOperation') or {}).get('id')
+        if not operation_id:
+            raise ShopifyAPIError("Bulk operation did not start", response_data=result)
+        
+        # Poll with backoff until the export finishes
+        deadline = time.monotonic() + timeout
+        interval = BULK_POLL_INTERVAL
+        while True:
+            time.sleep(interval)
+            status_response = self._make_graphql_request(CURRENT_BULK_OPERATION_QUERY)
+            operation = status_response.get('data', {}).get('currentBulkOperation')
+            # The shop has one current bulk query; if it is gone or is not ours
+            # (another app started one), ours can no longer be tracked
+            if not operation:
+                raise ShopifyAPIError(f"Bulk operation {operation_id} is no longer the current operation")
+            if operation.get('id') != operation_id:
+                raise ShopifyAPIError(
+                    f"Bulk operation {operation_id} was replaced by {operation.get('id')}",
+                    response_data=operation
+                )
+            status = operation.get('status')
+            
+            if status == 'COMPLETED':
+                break
+            if status in ('FAILED', 'CANCELED', 'EXPIRED'):
+                raise ShopifyAPIError(
+                    f"Bulk operation {status.lower()}: {operation.get('errorCode')}",
+                    response_data=operation
+                )
+            if time.monotonic() >= deadline:
+                raise ShopifyAPIError("Bulk operation timed out", response_data=operation)
+            interval = min(interval * 1.5, BULK_MAX_POLL_INTERVAL)
+        
+        self.logger.info(f"Bulk operation completed ({operation.get('objectCount')} objects)")
+        
+        # No url means the query matched nothing
+        url = operation.get('url')
+        if not url:
+            return
+        
+        # Signed storage URL: fetched without the Shopify session headers
+        with requests.get(url, stream=True, timeout=REQUEST_TIMEOUT) as result_response:
+            result_response.raise_for_status()
+            for line in result_response.iter_lines():
+                if line:
+                    yield json.loads(line)
+    
+    def _iter_products_range(self, query: str, search: Optional[str], low: int, high: int,
+                             page_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages of products with low < numeric id <= high."""
+        range_search = f"id:>{low} id:<={high}"
+        variables = {
+            "first": page_size,
+            "after": None,
+            "query": f"{search} {range_search}" if search else range_search,
+        }
+        
+        while True:
+            data = self._make_graphql_request(query, variables)
+            products_conn = (data.get('data') or {}).get('products') or {}
+            nodes = [edge['node'] for edge in products_conn.get('edges') or [] if (edge or {}).get('node')]
+            if nodes:
+                yield nodes
+            page_info = products_conn.get('pageInfo') or {}
+            if not page_info.get('hasNextPage'):
+                return
+            variables["after"] = page_info.get('endCursor')
+    
+    def _product_id_ranges(self, search: Optional[str], max_workers: int) -> List[tuple]:
+        """Split the numeric id span of matching products into at most max_workers (low, high] ranges."""
+        bounds = self._make_graphql_request(PRODUCT_ID_BOUNDS_QUERY, {"query": search})
+        bounds_data = bounds.get('data') or {}
+        lowest = extract_edges_nodes(bounds_data, ['lowest'])
+        highest = extract_edges_nodes(bounds_data, ['highest'])
+        if not lowest or not highest:
+            return []
+        
+        low = int(extract_id_from_gid(lowest[0]['id'])) - 1
+        high = int(extract_id_from_gid(highest[0]['id']))
+        step = -(-(high - low) // max_workers)
+        return [(start, min(start + step, high)) for start in range(low, high, step)]
+    
+    def paginate_products_parallel(self, query: str, search: Optional[str] = None,
+                                   max_workers: int = 8, page_size: int = 50) -> List[Dict[str, Any]]:
+        """
+        Fetch every product matching a paginated query, paging several id ranges at once.
+        
+        Cursors are inherently serial, so the product id space is split into
+        disjoint 'id:>low id:<=high' ranges that are paged concurrently; the
+        shared session pools the connections and _make_graphql_request
+        handles throttling.
+        
+        api_calls_made and total_cost_used are bumped from the worker threads
+        without a lock, so after a parallel fetch they are approximate.
+        
+        Args:
+            query (str): Products query taking $first, $after and $query variables
+            search (str, optional): Extra product search filter (e.g. 'status:active')
+            max_workers (int): Number of id ranges paged concurrently
+            page_size (int): Products per page
+            
+        Returns:
+            List[Dict[str, Any]]: Product nodes grouped by ascending id range; within
+            a range they follow the query's sort order, so the whole list is in
+            ascending id order only when the query uses sortKey: ID
+        """
+        ranges = self._product_id_ranges(search, max_workers)
+        if not ranges:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            pages = executor.map(
+                lambda bounds_range: [
+                    node
+                    for page in self._iter_products_range(query, search, *bounds_range, page_size)
+                    for node in page
+                ],
+                ranges
+            )
+            return [node for page in pages for node in page]
+    
+    def iter_products_parallel(self, query: str, search: Optional[str] = None, max_workers: int = 8,
+                               page_size: int = 50, prefetch: int = 2) -> Iterator[Dict[str, Any]]:
+        """
+        Stream every product matching a paginated query while further pages are in flight.
+        
+        Same id-range split as paginate_products_parallel, but each page is
+        handed over through a bounded queue as soon as it arrives, so the
+        caller can format and write one page while the next ones are fetched.
+        The call counters are approximate, as for paginate_products_parallel.
+        
+        Args:
+            query (str): Products query taking $first, $after and $query variables
+            search (str, optional): Extra product search filter (e.g. 'status:active')
+            max_workers (int): Number of id ranges paged concurrently
+            page_size (int): Products per page
+            prefetch (int): Pages buffered ahead of the consumer
+            
+        Yields:
+            Dict[str, Any]: Product nodes, in page arrival order
+        """
+        ranges = self._product_id_ranges(search, max_workers)
+        if not ranges:
+            return
+        
+        pages: queue.Queue = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        range_done = object()
+        
+        def offer(item: Any) -> bool:
+            # Give up once the consumer has gone away instead of blocking forever
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce(bounds_range: tuple) -> None:
+            try:
+                for page in self._iter_products_range(query, search, *bounds_range, page_size):
+                    if not offer(page):
+                        return
+            except Exception as e:
+                offer(e)
+            else:
+                offer(range_done)
+        
+        executor = ThreadPoolExecutor(max_workers=len(ranges))
+        try:
+            for bounds_range in ranges:
+                executor.submit(produce, bounds_range)
+            
+            remaining = len(ranges)
+            while remaining:
+                item = pages.get()
+                if item is range_done:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield from item
+        finally:
+            stop.set()
+            executor.shutdown(wait=True)
+    
     def get_product_variants(self, product_id: str) -> Dict[str, Any]:
         """
         Get all variants for a specific product.
@@ -7,7 +7,12 @@ DEFAULT_API_VERSION = "2024-10"
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 1  # seconds
 REQUEST_TIMEOUT = 30  # seconds
+HTTP_POOL_MAXSIZE = 20  # keep-alive connections per host shared by concurrent calls
 MAX_BULK_OPERATIONS = 100
+BULK_POLL_INTERVAL = 2  # seconds, grows with backoff while the export runs
+BULK_MAX_POLL_INTERVAL = 30  # seconds
+BULK_OPERATION_TIMEOUT = 3600  # seconds
+MAX_NODES_PER_QUERY = 250  # ids accepted by one nodes(ids: ...) lookup
 
 # GraphQL Query Templates
 SHOP_INFO_QUERY = """
@@ -381,6 +386,44 @@ query getLocations {
 }
 """
 
+BULK_OPERATION_RUN_QUERY_MUTATION = """
+mutation bulkOperationRunQuery($query: String!) {
+    bulkOperationRunQuery(query: $query) {
+        bulkOperation {
+            id
+            status
+        }
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+PRODUCT_ID_BOUNDS_QUERY = """
+query productIdBounds($query: String) {
+    lowest: products(first: 1, sortKey: ID, query: $query) {
+        edges { node { id } }
+    }
+    highest: products(first: 1, sortKey: ID, reverse: true, query: $query) {
+        edges { node { id } }
+    }
+}
+"""
+
+CURRENT_BULK_OPERATION_QUERY = """
+query {
+    currentBulkOperation {
+        id
+        status
+        errorCode
+        objectCount
+        url
+    }
+}
+"""
+
 # Shopify GraphQL ID prefixes
 GRAPHQL_ID_PREFIXES = {
     'product': 'gid://shopify/Product/',
@@ -5,7 +5,8 @@ Provides helper functions for ID formatting, response processing, and data valid
 """
 
 import re
-from typing import Union, Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Union, Optional, Dict, Any, Iterable, Iterator, List, Tuple
 from .constants import GRAPHQL_ID_PREFIXES
 
 
@@ -319,6 +320,29 @@ def sanitize_search_query(query: str) -> str:
     return sanitized[:255]
 
 
+# Characters mapped to '_' when a store domain or title becomes part of a filename
+_FILENAME_UNSAFE_TABLE = str.maketrans({ch: "_" for ch in ' ./\\:*?"<>|-'})
+
+
+def sanitize_filename_component(text: str) -> str:
+    """
+    Make text safe to embed in a filename.
+    
+    Args:
+        text (str): Text such as a shop domain
+        
+    Returns:
+        str: Lowercased text of at most 80 characters with unsafe characters
+        replaced by '_', or 'store' when nothing is left
+        
+    Examples:
+        >>> sanitize_filename_component("AstroSouks.myshopify.com")
+        'astrosouks_myshopify_com'
+    """
+    # The mapping is 1:1 per character, so truncating first bounds the work
+    return (text or "").strip().lower()[:80].translate(_FILENAME_UNSAFE_TABLE) or "store"
+
+
 def chunk_list(items: List[Any], chunk_size: int) -> List[List[Any]]:
     """
     Split a list into chunks of specified size.
@@ -333,4 +357,68 @@ def chunk_list(items: List[Any], chunk_size: int) -> List[List[Any]]:
     if not isinstance(items, list) or chunk_size <= 0:
         return []
     
-    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)] 
\ No newline at end of file
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+# String literals, or runs of whitespace and comments (collapsed to one space)
+_GRAPHQL_TOKEN_RE = re.compile(r'"(?:\\.|[^"\\])*"|(?:\s|#[^\n]*)+')
+
+
+def _minify_graphql_token(match: "re.Match[str]") -> str:
+    token = match.group(0)
+    # String literals keep their exact content
+    return token if token.startswith('"') else ' '
+
+
+@lru_cache(maxsize=256)
+def minify_graphql(query: str) -> str:
+    """
+    Collapse insignificant whitespace and comments in a GraphQL document.
+    
+    Queries are module-level constants, so each distinct document is minified
+    once and every later request sends the compact form.
+    
+    Args:
+        query (str): GraphQL query or mutation
+        
+    Returns:
+        str: Equivalent single-line document
+        
+    Examples:
+        >>> minify_graphql('query {   shop {  name  }  }')
+        'query { shop { name } }'
+    """
+    if '"""' in query:
+        # Block strings may hold significant whitespace; send as-is
+        return query
+    return _GRAPHQL_TOKEN_RE.sub(_minify_graphql_token, query).strip()
+
+
+def group_bulk_records(records: Iterable[Dict[str, Any]]) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """
+    Group bulk operation JSONL records into (parent, children) pairs.
+    
+    Bulk exports flatten nested connections: each child node is its own line
+    carrying the parent's id in '__parentId', written after its parent. Only
+    one parent is held in memory at a time.
+    
+    Args:
+        records (Iterable[Dict[str, Any]]): Parsed JSONL lines in file order
+        
+    Returns:
+        Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]: Top-level nodes with their children
+    """
+    parent = None
+    children: List[Dict[str, Any]] = []
+    
+    for record in records:
+        if '__parentId' not in record:
+            if parent is not None:
+                yield parent, children
+            parent = record
+            children = []
+        elif parent is not None:
+            children.append(record)
+    
+    if parent is not None:
+        yield parent, children
@@ -65,14 +65,6 @@ query getAllProducts($first: Int!, $after: String, $query: String) {
 """
 
 
-def _sanitize_filename_component(text: str) -> str:
-    sanitized = (text or "").strip().lower()
-    for ch in [" ", ".", "/", "\\", ":", "*", "?", "\"", "<", ">", "|"]:
-        sanitized = sanitized.replace(ch, "_")
-    sanitized = sanitized.replace("-", "_")
-    return sanitized[:80] or "store"
-
-
 def _format_block(product: Dict[str, Any]) -> str:
     lines: List[str] = []
     title = product.get("title") or product.get("handle") or "Unknown"
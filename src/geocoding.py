@@ -4,8 +4,18 @@ maps links. Wraps the same logic used in scripts/reverse_geocode_google_test.py
 so production code can import without depending on the script path.
 """
 
+from collections import OrderedDict
 from typing import Dict, Any, Optional, Tuple, List
+import functools
 import os
+import threading
+
+
+# Successful lookups keyed on coordinates rounded to 5 decimals (~1 m), so
+# repeat deliveries to the same building skip the 2-4 Google API calls
+_REVERSE_GEOCODE_CACHE_SIZE = 4096
+_reverse_geocode_cache: "OrderedDict[Tuple[float, float, str, Optional[str]], Dict[str, Any]]" = OrderedDict()
+_reverse_geocode_cache_lock = threading.Lock()
 
 
 def _component(components, *types) -> Optional[str]:
@@ -15,12 +25,48 @@ def _component(components, *types) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def _gmaps_client(api_key: str):
+    """One googlemaps client per key, shared across calls so its requests
+    session keeps connections to maps.googleapis.com alive."""
+    import googlemaps
+
+    return googlemaps.Client(key=api_key)
+
+
 def reverse_geocode(lat: float, lon: float, language: str = "en", region: Optional[str] = None) -> Dict[str, Any]:
     """Reverse-geocode lat/lon via Google Geocoding API and return normalized fields.
 
     Returns a dict with shape { success: bool, data?: {...}, error?: str }
     The data payload mirrors the test script, including address lines and props.
+    Google is always queried with the exact lat/lon given. Successful results
+    are cached (LRU) under the coordinates rounded to 5 decimals (~1 m), so a
+    later call within that cell gets the result of the first point looked up
+    there. Each caller gets its own copy of the result and data dicts;
+    failures are never cached.
     """
+    key = (round(lat, 5), round(lon, 5), language, region)
+    with _reverse_geocode_cache_lock:
+        cached = _reverse_geocode_cache.get(key)
+        if cached is not None:
+            _reverse_geocode_cache.move_to_end(key)
+            return _copy_result(cached)
+
+    out = _reverse_geocode_uncached(lat, lon, language, region)
+    if out.get("success"):
+        with _reverse_geocode_cache_lock:
+            _reverse_geocode_cache[key] = _copy_result(out)
+            if len(_reverse_geocode_cache) > _REVERSE_GEOCODE_CACHE_SIZE:
+                _reverse_geocode_cache.popitem(last=False)
+    return out
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a successful result so callers editing it cannot change the cache."""
+    return {**result, "data": dict(result["data"])}
+
+
+def _reverse_geocode_uncached(lat: float, lon: float, language: str, region: Optional[str]) -> Dict[str, Any]:
     api_key = os.getenv("GOOGLE_MAPS_API")
     if not api_key:
         return {"success": False, "error": "Missing GOOGLE_MAPS_API env var"}
@@ -30,7 +76,7 @@ def reverse_geocode(lat: float, lon: float, language: str = "en", region: Option
     except Exception as e:
         return {"success": False, "error": f"googlemaps import failed: {e}"}
 
-    gmaps = googlemaps.Client(key=api_key)
+    gmaps = _gmaps_client(api_key)
     params: Dict[str, Any] = {
         "latlng": (lat, lon),
         "language": language,
@@ -77,7 +123,14 @@ def reverse_geocode(lat: float, lon: float, language: str = "en", region: Option
         "building_name": None,
     }
 
-    # Fallback postal code
+    # Fallback postal code: other results of the same response often carry
+    # one, so only spend an extra request when none of them do
+    if not norm["postal_code"]:
+        for other in results:
+            pc = _component(other.get("address_components", []), "postal_code")
+            if pc:
+                norm["postal_code"] = pc
+                break
     if not norm["postal_code"]:
         try:
             res_pc = gmaps.reverse_geocode(latlng=(lat, lon), language=language, result_type=["postal_code"]) or []
@@ -92,18 +145,19 @@ def reverse_geocode(lat: float, lon: float, language: str = "en", region: Option
     # Enrich with Place Details for building name if missing
     if not norm.get("premise") or not norm.get("street_number"):
         try:
-            bname, bplace_id = _nearest_building_name(gmaps, lat, lon, language, region)
+            bname, bplace_id, bcomponents = _nearest_building_name(gmaps, lat, lon, language, region)
         except Exception:
-            bname, bplace_id = (None, None)
+            bname, bplace_id, bcomponents = (None, None, None)
         if bname:
             norm["building_name"] = bname
             if not norm.get("premise"):
                 norm["premise"] = bname
             if not norm.get("route") and bplace_id:
                 try:
-                    p = gmaps.place(place_id=bplace_id, language=language, fields=["address_component"]) or {}
-                    ac = (p.get("result") or {}).get("address_components", [])
-                    maybe_route = _component(ac, "route")
+                    if bcomponents is None:
+                        p = gmaps.place(place_id=bplace_id, language=language, fields=["address_component"]) or {}
+                        bcomponents = (p.get("result") or {}).get("address_components", [])
+                    maybe_route = _component(bcomponents, "route")
                     if maybe_route:
                         norm["route"] = maybe_route
                 except Exception:
@@ -155,10 +209,11 @@ def _nearest_building_name(
     lon: float,
     language: str,
     region: Optional[str] = None,
-) -> Tuple[Optional[str], Optional[str]]:
+) -> Tuple[Optional[str], Optional[str], Optional[List[Dict[str, Any]]]]:
     """Search very close-by Places to infer a building name when street numbers are missing.
 
-    Returns: (building_name, place_id)
+    Returns: (building_name, place_id, address_components or None if no
+    Place Details call was needed)
     """
     try:
         nearby = gmaps.places_nearby(
@@ -168,7 +223,7 @@ def _nearest_building_name(
         ) or {}
         candidates = nearby.get("results", [])
         if not candidates:
-            return None, None
+            return None, None, None
 
         def nscore(place: Dict[str, Any]) -> Tuple[int, int, int]:
             types = set(place.get("types", []))
@@ -180,13 +235,18 @@ def _nearest_building_name(
         best = max(candidates, key=nscore)
         bname = best.get("name")
         bpid = best.get("place_id")
+        bcomponents = None
         if bpid and not bname:
             try:
-                details = gmaps.place(place_id=bpid, language=language, fields=["name"]) or {}
-                bname = (details.get("result") or {}).get("name")
+                # Ask for address components too, so a missing route can be
+                # filled from this same details call
+                details = gmaps.place(place_id=bpid, language=language, fields=["name", "address_component"]) or {}
+                result = details.get("result") or {}
+                bname = result.get("name")
+                bcomponents = result.get("address_components", [])
             except Exception:
                 pass
-        return (bname, bpid)
+        return (bname, bpid, bcomponents)
     except Exception:
-        return None, None
+        return None, None, None
 
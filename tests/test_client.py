@@ -22,7 +22,8 @@ from infobip_whatsapp_methods.models import (
     MediaMetadataResponse,
     MediaDownloadResponse,
     StatusResponse,
-    AutoResponseResult
+    AutoResponseResult,
+    WebhookMessage
 )
 from infobip_whatsapp_methods.exceptions import (
     AuthenticationError,
@@ -338,6 +339,40 @@ class TestLocationMessaging:
         with pytest.raises(ValidationError):
             client.send_location_preset("96170895652", "unknown_location")
 
+    @patch('infobip_whatsapp_methods.client.requests.request')
+    def test_send_location_preset_does_not_share_content(self, mock_request, client):
+        """Test that mutating a sent payload leaves the preset intact."""
+        from infobip_whatsapp_methods.models import LEBANON_LOCATIONS_PAYLOAD
+
+        def mutate(*args, **kwargs):
+            kwargs["json"]["content"]["name"] = "tampered"
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {"messageId": "preset_loc_123"}
+            mock_response.headers = {}
+            return mock_response
+        mock_request.side_effect = mutate
+
+        client.send_location_preset("96170895652", "beirut")
+
+        assert LEBANON_LOCATIONS_PAYLOAD["beirut"]["name"] == "Beirut, Lebanon"
+
+    @patch('infobip_whatsapp_methods.client.validate_location_params')
+    @patch('infobip_whatsapp_methods.client.requests.request')
+    def test_send_location_preset_honors_validate_input(self, mock_request, mock_validate, client):
+        """Test that validate_input controls preset validation."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"messageId": "preset_loc_123"}
+        mock_response.headers = {}
+        mock_request.return_value = mock_response
+
+        client.send_location_preset("96170895652", "tyre", validate_input=False)
+        mock_validate.assert_not_called()
+
+        client.send_location_preset("96170895652", "tyre", validate_input=True)
+        mock_validate.assert_called_once()
+
     @patch('infobip_whatsapp_methods.client.requests.request')
     def test_send_location_api_error(self, mock_request, client):
         """Test API error handling when sending a location."""
@@ -655,6 +690,36 @@ class TestAutoResponse:
         assert result.message_sent == True
         assert result.message_id == "auto_response_123"
     
+    def test_auto_respond_keyword_priority(self, client):
+        """Test partial matches follow the keyword order of the default templates."""
+        from infobip_whatsapp_methods.constants import AutoResponseTemplates
+        
+        for message in ["well goodbye friend", "thanks hi", "this is it", "thank you very much"]:
+            expected = next(
+                template for keyword, template in AutoResponseTemplates.KEYWORD_RESPONSES.items()
+                if keyword in message
+            )
+            result = client.auto_respond(message, sender_name="Antonio", send_response=False)
+            
+            assert result.response_text == expected.format(name="Antonio", message=message)
+            assert result.response_type == "keyword_match"
+    
+    @pytest.mark.parametrize("sender_name", [None, 42, "Antonio"])
+    def test_auto_respond_non_str_sender_name(self, client, sender_name):
+        """Test precompiled templates render any sender_name like str.format."""
+        from infobip_whatsapp_methods.constants import AutoResponseTemplates
+        
+        for message in ["Hey there!", "Some random message"]:
+            template = next(
+                (template for keyword, template in AutoResponseTemplates.KEYWORD_RESPONSES.items()
+                 if keyword in message.lower()),
+                AutoResponseTemplates.DEFAULT_RESPONSE
+            )
+            result = client.auto_respond(message, sender_name=sender_name, send_response=False)
+            
+            assert result.success
+            assert result.response_text == template.format(name=sender_name, message=message)
+    
     def test_auto_respond_custom_templates(self, client):
         """Test auto-response with custom templates."""
         custom_templates = {
@@ -670,6 +735,29 @@ class TestAutoResponse:
         
         assert "This is a test response for Antonio!" == result.response_text
 
+    @patch('infobip_whatsapp_methods.client.requests.request')
+    def test_auto_respond_many(self, mock_request, client):
+        """Test batch auto-responses are generated in order and sent concurrently."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "messages": [{"messageId": "batch_response"}]
+        }
+        mock_response.headers = {}
+        mock_request.return_value = mock_response
+        
+        results = client.auto_respond_many([
+            ("Hello", "Antonio", "96170895652"),
+            ("Random question", "Maya", "96171234567"),
+            ("Thanks", "Rami", None),
+            ("   ", "Nour", "96171234568")
+        ])
+        
+        assert [r.response_type for r in results[:3]] == ["keyword_match", "default", "keyword_match"]
+        assert [r.message_sent for r in results] == [True, True, False, False]
+        assert not results[3].success
+        assert mock_request.call_count == 2
+    
     @patch('infobip_whatsapp_methods.client.requests.request')
     def test_auto_respond_send_failure(self, mock_request, client):
         """Test auto-response when message sending fails."""
@@ -754,7 +842,71 @@ class TestWebhookHelpers:
         
         assert message.message_type == "image"
         assert message.media_url == "https://example.com/webhook_image.jpg"
+    
+    def test_parse_webhook_payload_skips_malformed_records(self, client):
+        """Test a malformed record does not drop the rest of the batch."""
+        payload = {
+            "results": [
+                {
+                    "messageId": "good_1",
+                    "from": "96170123456",
+                    "to": "96179374241",
+                    "receivedAt": "2024-01-01T12:00:00+00:00",
+                    "message": {"text": "First", "type": "TEXT"}
+                },
+                {"messageId": "bad", "receivedAt": "not a timestamp"},
+                {
+                    "messageId": "good_2",
+                    "from": "96170123456",
+                    "to": "96179374241",
+                    "receivedAt": "2024-01-01T12:00:00+00:00",
+                    "message": {"url": "https://example.com/a.ogg", "type": "AUDIO"}
+                }
+            ]
+        }
+        
+        messages = client.parse_webhook_payload(payload)
+        
+        assert [m.message_id for m in messages] == ["good_1", "good_2"]
+        assert messages[0].text == "First"
+        assert messages[1].media_url == "https://example.com/a.ogg"
+    
+    def test_parse_webhook_payload_raw_payload_opt_in(self, client):
+        """Test raw payloads are only retained when requested."""
+        result = {
+            "messageId": "webhook_msg_3",
+            "from": "96170123456",
+            "to": "96179374241",
+            "receivedAt": "2024-01-01T12:10:00+00:00",
+            "message": {"text": "Hi", "type": "TEXT"}
+        }
+        
+        message = client.parse_webhook_payload({"results": [result]})[0]
+        assert message.raw_payload is None
+        assert message.to_payload() == result
+        
+        message = client.parse_webhook_payload({"results": [result]}, keep_raw=True)[0]
+        assert message.raw_payload is result
+        
+    def test_parse_webhook_payload_as_tuples(self, client):
+        """Test the lightweight tuple form round-trips to WebhookMessage."""
+        result = {
+            "messageId": "webhook_msg_4",
+            "from": "96170123456",
+            "to": "96179374241",
+            "receivedAt": "2024-01-01T12:15:00+00:00",
+            "message": {"type": "IMAGE", "url": "https://example.com/a.jpg"}
+        }
         
+        message = client.parse_webhook_payload({"results": [result]}, as_tuples=True)[0]
+        assert isinstance(message, tuple)
+        assert message.message_type == "image"
+        assert message.media_url == "https://example.com/a.jpg"
+        
+        full = WebhookMessage.from_tuple(message)
+        assert full.is_media_message
+        assert full.to_tuple() == message
+
     def test_parse_webhook_payload_empty(self, client):
         """Test parsing an empty or invalid webhook payload."""
         assert client.parse_webhook_payload({}) == []
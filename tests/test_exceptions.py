@@ -6,6 +6,8 @@ and that the `create_exception_from_response` function maps HTTP status codes
 and response data to the appropriate exception types.
 """
 
+import copy
+import pickle
 import pytest
 import sys
 import os
@@ -20,6 +22,8 @@ from infobip_whatsapp_methods.exceptions import (
     ValidationError,
     NetworkError,
     APIError,
+    MediaError,
+    TemplateError,
     create_exception_from_response
 )
 
@@ -65,6 +69,47 @@ class TestExceptionHierarchy:
         assert "Invalid phone number" in str(err)
         assert "Field: phone" in str(err)
         assert "Value: 123" in str(err)
+    
+    def test_str_is_cached(self):
+        """Test the rendered string is built once and reused."""
+        err = RateLimitError("Slow down", retry_after=5, status_code=429)
+        rendered = str(err)
+        
+        assert rendered == "WhatsAppError: Slow down | Status Code: 429 | Retry After: 5s"
+        assert str(err) is rendered
+
+
+# One fully populated instance per exception class
+ROUND_TRIP_CASES = [
+    WhatsAppError("Base error", status_code=500, error_code="E100", details={"key": "value"}),
+    AuthenticationError(status_code=401),
+    RateLimitError("Slow down", retry_after=5, quota_exceeded=True, status_code=429),
+    ValidationError("Invalid phone number", field="phone", value="123", validation_errors=["too short"]),
+    NetworkError(status_code=503),
+    APIError("Server error", api_response={"error": "boom"}, user_errors=["boom"], status_code=500),
+    MediaError("Too large", media_url="https://example.com/a.png", file_size=2048, content_type="image/png"),
+    TemplateError("Mismatch", template_name="welcome", variables_provided=1, variables_expected=2),
+]
+
+
+@pytest.mark.parametrize("err", ROUND_TRIP_CASES, ids=lambda err: type(err).__name__)
+class TestExceptionRoundTrip:
+    """Test that pickle and copy keep every exception attribute."""
+    
+    def test_pickle_round_trip(self, err):
+        """Test that a pickled exception comes back with the same state."""
+        restored = pickle.loads(pickle.dumps(err))
+        
+        assert type(restored) is type(err)
+        assert vars(restored) == vars(err)
+        assert str(restored) == str(err)
+    
+    def test_copy_round_trip(self, err):
+        """Test that copy and deepcopy keep the same state."""
+        for restored in (copy.copy(err), copy.deepcopy(err)):
+            assert type(restored) is type(err)
+            assert vars(restored) == vars(err)
+            assert str(restored) == str(err)
 
 
 class TestCreateExceptionFromResponse:
@@ -0,0 +1,124 @@
+"""
+Unit tests for infobip_whatsapp_methods.models module.
+
+Tests the response dataclasses' public constructor surface and the
+helpers that build API payloads.
+"""
+
+import pytest
+import sys
+import os
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+
+# Add the parent directory to the path so we can import the module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from infobip_whatsapp_methods.models import (
+    MessageResponse,
+    StatusResponse,
+    MediaMetadataResponse,
+    TemplateData,
+    LocationData,
+    validate_locations
+)
+
+
+class TestResponseTimestamps:
+    """Test the defaulted timestamp on response models."""
+
+    @pytest.mark.parametrize("cls", [MessageResponse, StatusResponse])
+    def test_timestamp_keyword_is_accepted(self, cls):
+        """Test that callers can still pass timestamp= explicitly."""
+        when = datetime(2024, 1, 2, 3, 4, 5)
+        response = cls(success=True, timestamp=when)
+
+        assert response.timestamp == when
+
+    @pytest.mark.parametrize("cls", [MessageResponse, StatusResponse])
+    def test_timestamp_defaults_to_now(self, cls):
+        """Test that the timestamp defaults to the creation time."""
+        before = datetime.now()
+        response = cls(success=True)
+
+        assert before <= response.timestamp <= datetime.now()
+
+    @pytest.mark.parametrize("cls", [MessageResponse, StatusResponse])
+    def test_aware_timestamp_round_trips(self, cls):
+        """Test that an aware timestamp keeps its tzinfo."""
+        when = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=2)))
+        response = cls(success=True, timestamp=when)
+
+        assert response.timestamp is when
+        assert response.timestamp.tzinfo == timezone(timedelta(hours=2))
+        assert asdict(response)["timestamp"] == when
+
+    def test_timestamp_takes_part_in_eq(self):
+        """Test that responses created at different times are not equal."""
+        first = MessageResponse(success=True, message_id="abc", timestamp=datetime(2020, 1, 1))
+        second = MessageResponse(success=True, message_id="abc")
+
+        assert first != second
+        assert first == MessageResponse(success=True, message_id="abc", timestamp=datetime(2020, 1, 1))
+
+    def test_to_dict_serializes_timestamp(self):
+        """Test that to_dict renders the timestamp as ISO text."""
+        when = datetime(2024, 1, 2, 3, 4, 5)
+        response = MessageResponse(success=False, error="boom", timestamp=when)
+
+        assert response.to_dict()["timestamp"] == when.isoformat()
+
+
+class TestFileSizeMb:
+    """Test the megabyte conversion on media responses."""
+
+    @pytest.mark.parametrize("size", [1, 131072, 136315, 5242, 393216, 1048576, 5_123_456, 104_857_599])
+    def test_matches_round(self, size):
+        """Test that file_size_mb agrees with round(), including exact ties."""
+        response = MediaMetadataResponse(success=True, content_length=size)
+
+        assert response.file_size_mb == round(size / (1024 * 1024), 2)
+
+    def test_exact_tie_rounds_to_even(self):
+        """Test that 131072 bytes (exactly 0.125 MB) gives 0.12."""
+        assert MediaMetadataResponse(success=True, content_length=131072).file_size_mb == 0.12
+
+    def test_missing_size(self):
+        """Test that an unknown size gives None."""
+        assert MediaMetadataResponse(success=True).file_size_mb is None
+
+
+class TestTemplatePayload:
+    """Test TemplateData.to_api_payload."""
+
+    def test_static_template_payloads_are_independent(self):
+        """Test that editing one payload does not leak into the next."""
+        template = TemplateData(template_name="welcome", header_image_url="https://example.com/a.png")
+
+        first = template.to_api_payload("111", "222")
+        first["messages"][0]["content"]["templateData"]["body"]["placeholders"].append("leaked")
+        first["messages"][0]["content"]["language"] = "fr"
+
+        second = TemplateData(template_name="welcome", header_image_url="https://example.com/a.png")
+        content = second.to_api_payload("111", "333")["messages"][0]["content"]
+        assert content["templateData"]["body"]["placeholders"] == []
+        assert content["language"] == "en"
+
+
+class TestValidateLocations:
+    """Test the batch coordinate validator."""
+
+    def test_matches_location_data_validate(self):
+        """Test that batch results agree with LocationData.validate."""
+        pairs = [(33.9, 35.5), (90, 180), (-90, -180), (90.1, 0), (0, -180.5), (float("nan"), 0)]
+
+        assert validate_locations(pairs) == [LocationData(lat, lon).validate() for lat, lon in pairs]
+        assert validate_locations(pairs) == [True, True, True, False, False, False]
+
+    def test_empty_batch(self):
+        """Test that an empty batch gives an empty result."""
+        assert validate_locations([]) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,298 @@
+"""
+Unit tests for the shopify_method client helpers.
+
+The HTTP session is replaced with a mock, so these tests exercise the
+request/response handling of bulk operations, node batching and
+parallel product paging without touching the network.
+"""
+
+import json
+import re
+import pytest
+from unittest.mock import patch, Mock
+import sys
+import os
+
+# Add the parent directory to the path so we can import the module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from shopify_method import ShopifyClient, ShopifyAPIError
+from shopify_method.constants import PRODUCTS_LIST_QUERY
+from shopify_method.utils import group_bulk_records, minify_graphql, sanitize_filename_component
+
+
+OPERATION_ID = "gid://shopify/BulkOperation/1"
+
+
+def _response(payload):
+    """Build a mocked 200 response carrying a GraphQL payload."""
+    response = Mock(status_code=200)
+    response.json.return_value = payload
+    return response
+
+
+def _posted(call):
+    """Decode the JSON body sent by ShopifyClient._make_graphql_request."""
+    return json.loads(call.kwargs["data"])
+
+
+@pytest.fixture
+def client():
+    """Client whose session is a mock."""
+    shopify = ShopifyClient("test-shop", "token")
+    shopify.session = Mock()
+    return shopify
+
+
+class TestRunBulkQuery:
+    """Test ShopifyClient.run_bulk_query."""
+
+    @staticmethod
+    def _started(operation_id=OPERATION_ID):
+        return _response({"data": {"bulkOperationRunQuery": {
+            "bulkOperation": {"id": operation_id, "status": "CREATED"},
+            "userErrors": []
+        }}})
+
+    @staticmethod
+    def _current(operation):
+        return _response({"data": {"currentBulkOperation": operation}})
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self):
+        with patch("shopify_method.client.time.sleep"):
+            yield
+
+    def test_completed_streams_records(self, client):
+        """Test that a completed export is downloaded and parsed line by line."""
+        client.session.post.side_effect = [
+            self._started(),
+            self._current({"id": OPERATION_ID, "status": "RUNNING"}),
+            self._current({"id": OPERATION_ID, "status": "COMPLETED", "objectCount": "2",
+                           "url": "https://storage.example/result.jsonl"}),
+        ]
+        download = Mock()
+        download.iter_lines.return_value = [b'{"id": "p1"}', b'', b'{"id": "v1", "__parentId": "p1"}']
+
+        with patch("shopify_method.client.requests.get") as get:
+            get.return_value.__enter__.return_value = download
+            records = list(client.run_bulk_query("{ products { edges { node { id } } } }"))
+
+        assert records == [{"id": "p1"}, {"id": "v1", "__parentId": "p1"}]
+        get.assert_called_once()
+        assert client.session.post.call_count == 3
+
+    def test_completed_without_url_yields_nothing(self, client):
+        """Test that an export matching nothing produces no records."""
+        client.session.post.side_effect = [
+            self._started(),
+            self._current({"id": OPERATION_ID, "status": "COMPLETED", "objectCount": "0", "url": None}),
+        ]
+
+        with patch("shopify_method.client.requests.get") as get:
+            assert list(client.run_bulk_query("{ products { edges { node { id } } } }")) == []
+        get.assert_not_called()
+
+    def test_failed_operation_raises(self, client):
+        """Test that a FAILED status raises with the error code."""
+        client.session.post.side_effect = [
+            self._started(),
+            self._current({"id": OPERATION_ID, "status": "FAILED", "errorCode": "ACCESS_DENIED"}),
+        ]
+
+        with pytest.raises(ShopifyAPIError, match="ACCESS_DENIED"):
+            list(client.run_bulk_query("{ products { edges { node { id } } } }"))
+
+    def test_null_current_operation_raises_immediately(self, client):
+        """Test that a vanished operation is reported instead of polled until timeout."""
+        client.session.post.side_effect = [self._started(), self._current(None)]
+
+        with pytest.raises(ShopifyAPIError, match="no longer the current operation"):
+            list(client.run_bulk_query("{ products { edges { node { id } } } }"))
+        assert client.session.post.call_count == 2
+
+    def test_replaced_operation_raises_immediately(self, client):
+        """Test that another app's bulk operation is not mistaken for ours."""
+        client.session.post.side_effect = [
+            self._started(),
+            self._current({"id": "gid://shopify/BulkOperation/2", "status": "COMPLETED",
+                           "url": "https://storage.example/other.jsonl"}),
+        ]
+
+        with pytest.raises(ShopifyAPIError, match="was replaced"):
+            list(client.run_bulk_query("{ products { edges { node { id } } } }"))
+
+    def test_timeout_raises(self, client):
+        """Test that a still-running operation raises once the deadline passes."""
+        client.session.post.side_effect = [
+            self._started(),
+            self._current({"id": OPERATION_ID, "status": "RUNNING"}),
+        ]
+
+        with pytest.raises(ShopifyAPIError, match="timed out"):
+            list(client.run_bulk_query("{ products { edges { node { id } } } }", timeout=0))
+
+
+class TestGetNodes:
+    """Test ShopifyClient.get_nodes."""
+
+    def test_batches_ids_and_skips_unresolved(self, client):
+        """Test that ids are sent in batches and null nodes are dropped."""
+        def reply(*args, **kwargs):
+            ids = json.loads(kwargs["data"])["variables"]["ids"]
+            return _response({"data": {"nodes": [
+                None if node_id.endswith("/3") else {"id": node_id, "title": node_id[-1]}
+                for node_id in ids
+            ]}})
+        client.session.post.side_effect = reply
+        ids = [f"gid://shopify/Product/{i}" for i in range(1, 6)]
+
+        nodes = client.get_nodes(ids, "... on Product { title }", batch_size=2)
+
+        assert client.session.post.call_count == 3
+        assert sorted(nodes) == [ids[0], ids[1], ids[3], ids[4]]
+        assert nodes[ids[4]]["title"] == "5"
+        assert "nodes(ids: $ids)" in _posted(client.session.post.call_args_list[0])["query"]
+
+
+class TestParallelProducts:
+    """Test id-range parallel paging over a fake store."""
+
+    PRODUCT_IDS = list(range(101, 124))
+
+    @pytest.fixture
+    def store(self, client):
+        """Answer the bounds query and 'id:>low id:<=high' range queries."""
+        def reply(*args, **kwargs):
+            body = json.loads(kwargs["data"])
+            if "lowest:" in body["query"]:
+                return _response({"data": {
+                    "lowest": {"edges": [{"node": {"id": f"gid://shopify/Product/{self.PRODUCT_IDS[0]}"}}]},
+                    "highest": {"edges": [{"node": {"id": f"gid://shopify/Product/{self.PRODUCT_IDS[-1]}"}}]},
+                }})
+            variables = body["variables"]
+            low, high = map(int, re.search(r"id:>(\d+) id:<=(\d+)", variables["query"]).groups())
+            matching = [i for i in self.PRODUCT_IDS if low < i <= high]
+            start = int(variables["after"] or 0)
+            page = matching[start:start + variables["first"]]
+            return _response({"data": {"products": {
+                "edges": [{"node": {"id": f"gid://shopify/Product/{i}"}} for i in page],
+                "pageInfo": {"hasNextPage": start + len(page) < len(matching),
+                             "endCursor": str(start + len(page))},
+            }}})
+        client.session.post.side_effect = reply
+        return client
+
+    def _expected(self):
+        return [f"gid://shopify/Product/{i}" for i in self.PRODUCT_IDS]
+
+    def test_paginate_products_parallel_returns_all_in_order(self, store):
+        """Test that every product is returned once, in ascending id order."""
+        products = store.paginate_products_parallel(PRODUCTS_LIST_QUERY, max_workers=4, page_size=3)
+
+        assert [p["id"] for p in products] == self._expected()
+
+    def test_iter_products_parallel_yields_every_product(self, store):
+        """Test that the streaming variant yields each product exactly once."""
+        products = list(store.iter_products_parallel(PRODUCTS_LIST_QUERY, max_workers=4, page_size=3))
+
+        assert sorted(p["id"] for p in products) == self._expected()
+        assert len(products) == len(self.PRODUCT_IDS)
+
+    def test_iter_products_parallel_propagates_worker_errors(self, store):
+        """Test that a failing range surfaces to the consumer."""
+        reply = store.session.post.side_effect
+
+        def failing(*args, **kwargs):
+            if "id:>" in kwargs["data"].decode() and '"after":"3"' in kwargs["data"].decode():
+                raise ValueError("boom")
+            return reply(*args, **kwargs)
+        store.session.post.side_effect = failing
+
+        with patch("shopify_method.client.time.sleep"), pytest.raises(ShopifyAPIError):
+            list(store.iter_products_parallel(PRODUCTS_LIST_QUERY, max_workers=2, page_size=3))
+
+    def test_empty_store(self, client):
+        """Test that no bounds means no range queries."""
+        client.session.post.return_value = _response({"data": {
+            "lowest": {"edges": []}, "highest": {"edges": []}
+        }})
+
+        assert client.paginate_products_parallel(PRODUCTS_LIST_QUERY) == []
+        assert list(client.iter_products_parallel(PRODUCTS_LIST_QUERY)) == []
+        assert client.session.post.call_count == 2
+
+
+class TestGroupBulkRecords:
+    """Test utils.group_bulk_records."""
+
+    def test_groups_children_under_parents(self):
+        """Test that child lines attach to the preceding parent."""
+        records = [
+            {"id": "p1"},
+            {"id": "m1", "__parentId": "p1"},
+            {"id": "m2", "__parentId": "p1"},
+            {"id": "p2"},
+            {"id": "p3"},
+            {"id": "m3", "__parentId": "p3"},
+        ]
+
+        grouped = [(parent["id"], [child["id"] for child in children])
+                   for parent, children in group_bulk_records(records)]
+
+        assert grouped == [("p1", ["m1", "m2"]), ("p2", []), ("p3", ["m3"])]
+
+    def test_orphans_and_empty_input(self):
+        """Test that leading orphan children are dropped and empty input yields nothing."""
+        assert list(group_bulk_records([])) == []
+        assert list(group_bulk_records([{"id": "m", "__parentId": "x"}])) == []
+
+
+class TestMinifyGraphql:
+    """Test utils.minify_graphql."""
+
+    def test_collapses_whitespace_and_comments(self):
+        """Test that layout whitespace and comments are removed."""
+        query = """
+        query products($first: Int!) {
+            # page of products
+            products(first: $first) {
+                edges { node { id } }
+            }
+        }
+        """
+
+        assert minify_graphql(query) == (
+            "query products($first: Int!) { products(first: $first) { edges { node { id } } } }"
+        )
+
+    def test_string_literals_are_preserved(self):
+        """Test that whitespace and '#' inside string literals are kept."""
+        query = 'query { products(query: "title:\\"a  b\\"  #tag") { edges { node { id } } } }'
+
+        assert '"title:\\"a  b\\"  #tag"' in minify_graphql(query)
+
+    def test_block_strings_are_left_untouched(self):
+        """Test that documents with block strings are sent as-is."""
+        query = 'mutation { x(text: """\n  keep  this\n""") }'
+
+        assert minify_graphql(query) == query
+
+
+class TestSanitizeFilenameComponent:
+    """Test utils.sanitize_filename_component."""
+
+    def test_replaces_unsafe_characters(self):
+        """Test that path and shell characters become underscores."""
+        assert sanitize_filename_component(" My-Shop.myshopify.com ") == "my_shop_myshopify_com"
+        assert sanitize_filename_component('a/b\\c:d*e?f"g<h>i|j') == "a_b_c_d_e_f_g_h_i_j"
+
+    def test_truncates_and_falls_back(self):
+        """Test the 80 character limit and the fallback for empty input."""
+        assert sanitize_filename_component("x" * 100) == "x" * 80
+        assert sanitize_filename_component("") == "store"
+        assert sanitize_filename_component(None) == "store"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
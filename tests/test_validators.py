@@ -17,6 +17,7 @@ from infobip_whatsapp_methods.validators import (
     validate_phone_number,
     validate_coordinates,
     validate_url,
+    validate_urls_batch,
     validate_message_text,
     validate_caption,
     validate_location_name,
@@ -154,7 +155,7 @@ class TestUrlValidation:
         # HTTPS URL should pass
         assert validate_url("https://example.com", require_https=True) == True
     
-    @patch('infobip_whatsapp_methods.validators.requests.head')
+    @patch('infobip_whatsapp_methods.validators._HEAD_SESSION.head')
     def test_url_accessibility_check(self, mock_head):
         """Test URL accessibility checking."""
         # Mock successful response
@@ -167,6 +168,25 @@ class TestUrlValidation:
         # Mock failed response
         mock_response.status_code = 404
         assert validate_url("https://example.com", check_accessibility=True) == False
+    
+    @patch('infobip_whatsapp_methods.validators._HEAD_SESSION.head')
+    def test_urls_batch_accessibility(self, mock_head):
+        """Test batch URL validation keeps input order."""
+        def head(url, **kwargs):
+            response = Mock()
+            response.status_code = 404 if "missing" in url else 200
+            return response
+        mock_head.side_effect = head
+        
+        urls = [
+            "https://example.com/a.jpg",
+            "https://example.com/missing.jpg",
+            "http://example.com/b.jpg",
+            "https://example.com/c.jpg"
+        ]
+        assert validate_urls_batch(urls) == [True, False, False, True]
+        assert mock_head.call_count == 3
+        assert validate_urls_batch([]) == []
 
 
 class TestMessageTextValidation: